@@ -1,13 +1,23 @@
+import argparse
 import asyncio
+import hashlib
+import html
+import os
 import re
+import sys
 import json
 import time
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from copy import deepcopy
+from types import MappingProxyType
+from typing import List, Dict, Set, Tuple, Iterator, Optional, Any
+from dataclasses import dataclass
 
 # Core dependencies
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.compat import chardet
+from urllib3.util.retry import Retry
 
 # Headless browser dependencies (optional)
 try:
@@ -17,58 +27,204 @@ except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("Warning: Playwright not installed. JavaScript execution disabled.")
 
+# Aho-Corasick multi-literal matcher (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Hyperscan SIMD multi-pattern matcher (optional)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# RE2 regex engine (optional, linear-time DFA)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# orjson serializer (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# xxHash for hashing page bodies (optional)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Python's Unicode \s, \d and \w as RE2 class contents; RE2's own shorthand classes are ASCII-only
+RE2_CLASS_BODIES = {
+    's': r'\t-\r\x1c-\x20\x85\xa0\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}',
+    'd': r'\p{Nd}',
+    'w': r'\p{L}\p{N}_'
+}
+
+# Characters that re.IGNORECASE matches against ASCII letters but RE2's case folding does not
+RE2_MISSING_FOLDS = ('\u0130', '\u0131')
+
+# The Python source of every pattern compiled with RE2, keyed by its rewritten form
+PATTERN_SOURCES: Dict[str, str] = {}
+
+def re2_pattern(pattern: str, flags: int = 0) -> Optional[str]:
+    """Rewrite a Python pattern so that RE2 matches exactly what re matches on str.
+    
+    Shorthand classes are spelled out with their Unicode members, and letters get the extra
+    case variants re.IGNORECASE accepts. None when the pattern uses a construct that cannot
+    be rewritten (word boundaries, negated shorthands inside a class).
+    """
+    ignorecase = bool(flags & re.IGNORECASE)
+    pattern = pattern.replace(r'[\s\S]', '(?s:.)')
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i + 1:i + 2]
+            if escape in RE2_CLASS_BODIES:
+                out.append(f'[{RE2_CLASS_BODIES[escape]}]')
+            elif escape.lower() in RE2_CLASS_BODIES:
+                out.append(f'[^{RE2_CLASS_BODIES[escape.lower()]}]')
+            elif escape in ('b', 'B'):
+                return None
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+        elif pattern.startswith('(?P<', i):
+            # Group names are copied as they are
+            end = pattern.index('>', i) + 1
+            out.append(pattern[i:end])
+            i = end
+        elif char == '[':
+            end = i + 1
+            negated = pattern.startswith('^', end)
+            if negated:
+                end += 1
+            body = [pattern[i + 1:end]]
+            if pattern.startswith(']', end):
+                body.append(']')
+                end += 1
+            while pattern[end] != ']':
+                if pattern[end] == '\\':
+                    escape = pattern[end + 1:end + 2]
+                    if escape in RE2_CLASS_BODIES:
+                        body.append(RE2_CLASS_BODIES[escape])
+                    elif escape.lower() in RE2_CLASS_BODIES or escape in ('b', 'B'):
+                        return None
+                    else:
+                        body.append(pattern[end:end + 2])
+                    end += 2
+                else:
+                    body.append(pattern[end])
+                    end += 1
+            end += 1
+            if ignorecase:
+                python_class = re.compile(pattern[i:end], flags)
+                # A negated class must exclude the variants re excludes
+                body.extend(f'\\x{{{ord(fold):x}}}' for fold in RE2_MISSING_FOLDS
+                            if bool(python_class.fullmatch(fold)) != negated)
+            out.append('[' + ''.join(body) + ']')
+            i = end
+        elif ignorecase and char.isalpha() and char.isascii():
+            folds = [fold for fold in RE2_MISSING_FOLDS if re.fullmatch(re.escape(char), fold, flags)]
+            out.append(f'[{char}' + ''.join(f'\\x{{{ord(fold):x}}}' for fold in folds) + ']' if folds else char)
+            i += 1
+        else:
+            out.append(char)
+            i += 1
+    return ''.join(out)
+
+def compile_pattern(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 when available and it can match what re matches, else with re"""
+    if RE2_AVAILABLE:
+        rewritten = re2_pattern(pattern, flags)
+        if rewritten is not None:
+            options = re2.Options()
+            options.case_sensitive = not flags & re.IGNORECASE
+            options.dot_nl = bool(flags & re.DOTALL)
+            PATTERN_SOURCES[rewritten] = pattern
+            return re2.compile(rewritten, options)
+    return re.compile(pattern, flags)
+
+def pattern_source(compiled) -> str:
+    """The Python source of a compiled pattern, whichever engine compiled it"""
+    return PATTERN_SOURCES.get(compiled.pattern, compiled.pattern)
+
 # Compiled regex patterns for performance
 class CompiledPatterns:
     def __init__(self):
+        # Script tag extraction (replaces a full HTML parse); comments are matched too so that
+        # commented-out scripts can be skipped
+        self.script_tag = compile_pattern(r'<!--[\s\S]*?-->|<script((?:[^\w>][^>]*)?)>([\s\S]*?)</script\s*>', re.IGNORECASE)
+        self.script_attr = compile_pattern(r'([^\s=/>]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+)))?')
+        
         # GTM patterns
-        self.gtm_container_id = re.compile(r'GTM-[A-Z0-9]{4,}', re.IGNORECASE)
-        self.gtm_script_url = re.compile(r'https://www\.googletagmanager\.com/gtm\.js\?id=([^&"\'\s]+)', re.IGNORECASE)
-        self.gtm_init_code = re.compile(r'gtm\.start["\']?\s*:\s*new\s+Date\(\)\.getTime\(\)', re.IGNORECASE | re.DOTALL)
-        self.gtm_datalayer = re.compile(r'dataLayer\s*=\s*\[|dataLayer\.push\s*\(', re.IGNORECASE)
-        self.gtm_noscript = re.compile(r'<noscript>.*?<iframe[^>]*src=["\']https://www\.googletagmanager\.com/ns\.html\?id=([^"\'&]+)', re.IGNORECASE | re.DOTALL)
-        self.gtm_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?googletagmanager\.com/gtm\.js', re.IGNORECASE | re.DOTALL)
+        self.gtm_container_id = compile_pattern(r'GTM-[A-Z0-9]{4,}', re.IGNORECASE)
+        self.gtm_script_url = compile_pattern(r'https://www\.googletagmanager\.com/gtm\.js\?id=([^&"\'\s]+)', re.IGNORECASE)
+        self.gtm_init_code = compile_pattern(r'gtm\.start["\']?\s*:\s*new\s+Date\(\)\.getTime\(\)', re.IGNORECASE | re.DOTALL)
+        self.gtm_datalayer = compile_pattern(r'dataLayer\s*=\s*\[|dataLayer\.push\s*\(', re.IGNORECASE)
+        self.gtm_noscript = compile_pattern(r'<noscript>.*?<iframe[^>]*src=["\']https://www\.googletagmanager\.com/ns\.html\?id=([^"\'&]+)', re.IGNORECASE | re.DOTALL)
+        self.gtm_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?googletagmanager\.com/gtm\.js', re.IGNORECASE | re.DOTALL)
+        # Single pass over the HTML for container IDs and dataLayer usage
+        self.gtm_combined = compile_pattern(
+            rf'(?P<cid>{pattern_source(self.gtm_container_id)})|(?P<dl>{pattern_source(self.gtm_datalayer)})', re.IGNORECASE)
         
         # Tealium patterns
-        self.tealium_url = re.compile(r'https://tags\.tiqcdn\.com/utag/([^/]+)/([^/]+)/([^/]+)/utag\.js', re.IGNORECASE)
-        self.tealium_utag_data = re.compile(r'var\s+utag_data\s*=\s*\{|utag_data\s*=\s*\{', re.IGNORECASE)
-        self.tealium_functions = re.compile(r'utag\.(link|view|track|sync)\s*\(', re.IGNORECASE)
-        self.tealium_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,300}?tags\.tiqcdn\.com', re.IGNORECASE | re.DOTALL)
+        self.tealium_url = compile_pattern(r'https://tags\.tiqcdn\.com/utag/([^/]+)/([^/]+)/([^/]+)/utag\.js', re.IGNORECASE)
+        self.tealium_utag_data = compile_pattern(r'var\s+utag_data\s*=\s*\{|utag_data\s*=\s*\{', re.IGNORECASE)
+        self.tealium_functions = compile_pattern(r'utag\.(link|view|track|sync)\s*\(', re.IGNORECASE)
+        self.tealium_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,300}?tags\.tiqcdn\.com', re.IGNORECASE | re.DOTALL)
+        # Single pass over script bodies for utag_data and utag.* calls
+        self.tealium_combined = compile_pattern(
+            rf'(?P<data>{pattern_source(self.tealium_utag_data)})|(?P<fn>{pattern_source(self.tealium_functions)})', re.IGNORECASE)
         
         # gtag patterns
-        self.gtag_measurement_id = re.compile(r'G-[A-Z0-9]{10}', re.IGNORECASE)
-        self.gtag_script_url = re.compile(r'https://www\.googletagmanager\.com/gtag/js\?id=([^&"\'\s]+)', re.IGNORECASE)
-        self.gtag_function = re.compile(r'gtag\s*\(\s*["\']config["\']|gtag\s*\(\s*["\']event["\']', re.IGNORECASE)
+        self.gtag_measurement_id = compile_pattern(r'G-[A-Z0-9]{10}', re.IGNORECASE)
+        self.gtag_script_url = compile_pattern(r'https://www\.googletagmanager\.com/gtag/js\?id=([^&"\'\s]+)', re.IGNORECASE)
+        self.gtag_function = compile_pattern(r'gtag\s*\(\s*["\']config["\']|gtag\s*\(\s*["\']event["\']', re.IGNORECASE)
 
         # Meta Pixel patterns
-        self.meta_pixel_id = re.compile(r'fbq\s*\(\s*["\']init["\']\s*,\s*["\'](\d{15,16})["\']', re.IGNORECASE)
-        self.meta_pixel_script_url = re.compile(r'https://connect\.facebook\.net/[^/]+/fbevents\.js', re.IGNORECASE)
-        self.meta_pixel_noscript = re.compile(r'<noscript>.*?<img[^>]*src=["\']https://www\.facebook\.com/tr\?id=(\d{15,16})', re.IGNORECASE | re.DOTALL)
-        self.meta_pixel_function = re.compile(r'fbq\s*\(\s*["\']track["\']\s*,', re.IGNORECASE)
+        self.meta_pixel_id = compile_pattern(r'fbq\s*\(\s*["\']init["\']\s*,\s*["\'](\d{15,16})["\']', re.IGNORECASE)
+        self.meta_pixel_script_url = compile_pattern(r'https://connect\.facebook\.net/[^/]+/fbevents\.js', re.IGNORECASE)
+        self.meta_pixel_noscript = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://www\.facebook\.com/tr\?id=(\d{15,16})', re.IGNORECASE | re.DOTALL)
+        self.meta_pixel_function = compile_pattern(r'fbq\s*\(\s*["\']track["\']\s*,', re.IGNORECASE)
 
         # TikTok Pixel patterns
-        self.tiktok_pixel_id = re.compile(r'ttq\.load\s*\(\s*["\']([^"\']+)["\']', re.IGNORECASE)
-        self.tiktok_script_url = re.compile(r'https://analytics\.tiktok\.com/i18n/pixel/events\.js', re.IGNORECASE)
-        self.tiktok_function = re.compile(r'ttq\.track\s*\(\s*["\']([^"\']+)["\']', re.IGNORECASE)
+        self.tiktok_pixel_id = compile_pattern(r'ttq\.load\s*\(\s*["\']([^"\']+)["\']', re.IGNORECASE)
+        self.tiktok_script_url = compile_pattern(r'https://analytics\.tiktok\.com/i18n/pixel/events\.js', re.IGNORECASE)
+        self.tiktok_function = compile_pattern(r'ttq\.track\s*\(\s*["\']([^"\']+)["\']', re.IGNORECASE)
 
         # LinkedIn Insight patterns
-        self.linkedin_partner_id = re.compile(r'linkedin\.com\/collect\?pid=(\d+)', re.IGNORECASE)
-        self.linkedin_script_url = re.compile(r'https://snap.licdn.com/li.lms-analytics/insight\.min\.js', re.IGNORECASE)
-        self.linkedin_function = re.compile(r'_linkedin_data_partner_id\s*=\s*["\'](\d+)["\']', re.IGNORECASE)
+        self.linkedin_partner_id = compile_pattern(r'linkedin\.com\/collect\?pid=(\d+)', re.IGNORECASE)
+        self.linkedin_script_url = compile_pattern(r'https://snap.licdn.com/li.lms-analytics/insight\.min\.js', re.IGNORECASE)
+        self.linkedin_function = compile_pattern(r'_linkedin_data_partner_id\s*=\s*["\'](\d+)["\']', re.IGNORECASE)
+        # Single pass over the HTML for collect-URL and variable partner IDs
+        self.linkedin_combined = compile_pattern(
+            r'linkedin\.com\/collect\?pid=(?P<pid>\d+)|_linkedin_data_partner_id\s*=\s*["\'](?P<fn>\d+)["\']', re.IGNORECASE)
 
         # Snap Pixel patterns
-        self.snap_pixel_id = re.compile(r'snaptr\s*\(\s*["\']init["\']\s*,\s*["\']([^"\']+)["\']', re.IGNORECASE)
-        self.snap_script_url = re.compile(r'https://sc-static\.net/scevent.min\.js', re.IGNORECASE)
-        self.snap_function = re.compile(r'snaptr\s*\(\s*["\']track["\']\s*,', re.IGNORECASE)
+        self.snap_pixel_id = compile_pattern(r'snaptr\s*\(\s*["\']init["\']\s*,\s*["\']([^"\']+)["\']', re.IGNORECASE)
+        self.snap_script_url = compile_pattern(r'https://sc-static\.net/scevent.min\.js', re.IGNORECASE)
+        self.snap_function = compile_pattern(r'snaptr\s*\(\s*["\']track["\']\s*,', re.IGNORECASE)
 
         # Universal Analytics patterns
-        self.ua_tracking_id = re.compile(r'UA-\d{4,10}-\d{1,4}', re.IGNORECASE)
-        self.ua_script_url = re.compile(r'https://www\.google-analytics\.com/analytics\.js', re.IGNORECASE)
-        self.ua_function = re.compile(r'ga\s*\(\s*["\']create["\']|ga\s*\(\s*["\']send["\']', re.IGNORECASE)
+        self.ua_tracking_id = compile_pattern(r'UA-\d{4,10}-\d{1,4}', re.IGNORECASE)
+        self.ua_script_url = compile_pattern(r'https://www\.google-analytics\.com/analytics\.js', re.IGNORECASE)
+        self.ua_function = compile_pattern(r'ga\s*\(\s*["\']create["\']|ga\s*\(\s*["\']send["\']', re.IGNORECASE)
 
         # SPA and progressive loading patterns
-        self.spa_frameworks = re.compile(r'react|angular|vue|next\.js|nuxt|gatsby|svelte', re.IGNORECASE)
-        self.progressive_loading = re.compile(r'intersectionobserver|requestidlecallback|loading\s*=\s*["\']lazy["\']', re.IGNORECASE)
-        self.consent_managers = re.compile(r'cookiebot|onetrust|usercentrics|trustarc|iubenda', re.IGNORECASE)
+        self.spa_frameworks = compile_pattern(r'react|angular|vue|next\.js|nuxt|gatsby|svelte', re.IGNORECASE)
+        self.progressive_loading = compile_pattern(r'intersectionobserver|requestidlecallback|loading\s*=\s*["\']lazy["\']', re.IGNORECASE)
+        self.consent_managers = compile_pattern(r'cookiebot|onetrust|usercentrics|trustarc|iubenda', re.IGNORECASE)
         
         # Tag domains for network monitoring
         self.tag_domains = {
@@ -81,8 +237,83 @@ class CompiledPatterns:
             'sc-static.net',
             'tags.tiqcdn.com'
         }
+        
+        # Lowercase literals at least one of which must be present for a detector to score
+        self.detector_anchors = {
+            'gtm': ('gtm-', 'gtm.start', 'datalayer', 'googletagmanager'),
+            'tealium': ('tiqcdn', 'utag'),
+            'gtag': ('g-', 'gtag'),
+            'meta_pixel': ('fbq', 'facebook'),
+            'tiktok_pixel': ('ttq', 'tiktok'),
+            'linkedin_insight': ('linkedin', 'licdn'),
+            'snap_pixel': ('snaptr', 'sc-static'),
+            'universal_analytics': ('ua-', 'google-analytics', '"create"', "'create'", '"send"', "'send'")
+        }
+        self.anchor_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            anchor_owners = {}
+            for detector, anchors in self.detector_anchors.items():
+                for anchor in anchors:
+                    anchor_owners.setdefault(anchor, set()).add(detector)
+            self.anchor_automaton = ahocorasick.Automaton()
+            for anchor, detectors in anchor_owners.items():
+                self.anchor_automaton.add_word(anchor, frozenset(detectors))
+            self.anchor_automaton.make_automaton()
+        
+        # Same anchors as one Hyperscan block-mode database; pattern IDs index anchor_detectors
+        self.anchor_database = None
+        self.anchor_detectors = [detector for detector, anchors in self.detector_anchors.items() for _ in anchors]
+        if HYPERSCAN_AVAILABLE:
+            expressions = [re.escape(anchor).encode() for anchors in self.detector_anchors.values() for anchor in anchors]
+            self.anchor_database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            self.anchor_database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+            )
+
+# Patterns are immutable, so compile them once and share across checker instances
+PATTERNS = CompiledPatterns()
 
-@dataclass
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+})
+
+# Report separators
+_SEP = "=" * 60
+_SEP_LINE = "\n" + _SEP
+
+# Tags live near the top of the document, so stop downloading after this many bytes
+MAX_HTML_BYTES = 512 * 1024
+
+# Playwright resource types aborted while rendering ('other' covers favicons)
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'stylesheet', 'font', 'media', 'other'})
+
+# Minimum confidence score for each tag to count as found
+DETECTION_THRESHOLDS = {
+    'gtm': 35,
+    'tealium': 30,
+    'gtag': 30,
+    'meta_pixel': 30,
+    'tiktok_pixel': 30,
+    'linkedin_insight': 30,
+    'snap_pixel': 30,
+    'universal_analytics': 35
+}
+
+# Number of detection results kept in the per-checker body-hash cache
+DETECTION_CACHE_SIZE = 1024
+
+@dataclass(slots=True)
 class TagDetectionResult:
     found: bool = False
     confidence_score: int = 0
@@ -106,51 +337,98 @@ class TagDetectionResult:
             self.implementation_details = []
         if self.warnings is None:
             self.warnings = []
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form of the result (cheaper than dataclasses.asdict)"""
+        return {
+            'found': self.found,
+            'confidence_score': self.confidence_score,
+            'identifiers': self.identifiers,
+            'detection_methods': self.detection_methods,
+            'verification_checks': self.verification_checks,
+            'implementation_details': self.implementation_details,
+            'warnings': self.warnings,
+            'loading_method': self.loading_method,
+            'progressive_loading_detected': self.progressive_loading_detected,
+            'spa_detected': self.spa_detected
+        }
 
 class SingleUrlTagChecker:
     """Simplified tag checker for single URL analysis"""
     
-    def __init__(self, use_javascript: bool = True, timeout: int = 20):
+    def __init__(self, use_javascript: bool = True, timeout: int = 20, static_fast_path: bool = True):
         self.use_javascript = use_javascript and PLAYWRIGHT_AVAILABLE
         self.timeout = timeout
-        self.patterns = CompiledPatterns()
-        self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        self.static_fast_path = static_fast_path
+        self.patterns = PATTERNS
+        self.user_agent = USER_AGENT
+        
+        # Shared session so TCP/TLS connections are reused across requests
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Playwright browser shared across URLs (started on first use)
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._browser_lock = asyncio.Lock()
+        
+        # Hyperscan scratch space is per-thread state, so each checker keeps its own
+        self._hs_scratch = hyperscan.Scratch(self.patterns.anchor_database) if self.patterns.anchor_database else None
+        
+        # Detection results keyed by a hash of the HTML and captured request URLs
+        self._det_cache: 'OrderedDict[int, Dict]' = OrderedDict()
     
     def get_headers(self) -> Dict[str, str]:
-        return {
-            'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        }
+        return dict(DEFAULT_HEADERS)
     
     def detect_progressive_loading(self, html_content: str) -> bool:
         """Detect progressive loading patterns in SPAs"""
         return bool(self.patterns.progressive_loading.search(html_content) or
                    self.patterns.spa_frameworks.search(html_content))
     
+    def parse_script_attributes(self, attr_text: str) -> Dict[str, str]:
+        """Parse the attribute string of a script tag into a dict"""
+        attributes = {}
+        for match in self.patterns.script_attr.finditer(attr_text):
+            name, double_quoted, single_quoted, unquoted = match.groups()
+            value = next((v for v in (double_quoted, single_quoted, unquoted) if v is not None), '')
+            attributes.setdefault(name.lower(), html.unescape(value))
+        return attributes
+    
     def extract_scripts(self, html_content: str) -> List[Dict]:
         """Extract script elements from HTML"""
-        try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-        except Exception:
-            return []
-        
         scripts = []
-        for script in soup.find_all('script'):
+        for match in self.patterns.script_tag.finditer(html_content):
+            if match.group(1) is None:
+                continue
+            attributes = self.parse_script_attributes(match.group(1))
             scripts.append({
-                'src': script.get('src', ''),
-                'content': script.string or '',
-                'type': script.get('type', ''),
-                'async': script.has_attr('async'),
-                'defer': script.has_attr('defer')
+                'src': attributes.get('src', ''),
+                'content': match.group(2),
+                'type': attributes.get('type', ''),
+                'async': 'async' in attributes,
+                'defer': 'defer' in attributes
             })
         return scripts
     
-    def detect_gtm(self, html_content: str, scripts: List[Dict], 
+    def _finalize(self, result: TagDetectionResult, tag: str, identifiers) -> TagDetectionResult:
+        """Mark the result found once it clears the tag's threshold"""
+        if result.confidence_score >= DETECTION_THRESHOLDS[tag]:
+            result.found = True
+            result.identifiers = list(identifiers)
+        return result
+    
+    def _scan_scripts(self, scripts: List[Dict], pattern) -> Iterator:
+        """Yield pattern matches from each inline script body in turn"""
+        for script in scripts:
+            if script['content']:
+                yield from pattern.finditer(script['content'])
+    
+    def detect_gtm(self, html_content: str, scripts: List[Dict],
                    network_requests: List[Dict] = None) -> TagDetectionResult:
         """Detect Google Tag Manager"""
         result = TagDetectionResult()
@@ -161,14 +439,17 @@ class SingleUrlTagChecker:
         
         # Container ID detection
         container_ids = set()
-        for match in self.patterns.gtm_container_id.finditer(html_content):
-            container_id = match.group(0).upper()
+        datalayer_found = False
+        for match in self.patterns.gtm_combined.finditer(html_content):
+            if match.lastgroup == 'dl':
+                datalayer_found = True
+                continue
+            container_id = match.group('cid').upper()
             if len(container_id) >= 8:
                 container_ids.add(container_id)
                 result.confidence_score += 40
         
         if container_ids:
-            result.identifiers = list(container_ids)
             result.detection_methods.append('Container ID Detection')
         
         # Script URL detection
@@ -184,12 +465,11 @@ class SingleUrlTagChecker:
                         result.loading_method = 'direct_script'
         
         # Other detections
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if self.patterns.gtm_init_code.search(all_scripts):
+        if any(self._scan_scripts(scripts, self.patterns.gtm_init_code)):
             result.confidence_score += 20
             result.detection_methods.append('Initialization Code')
         
-        if self.patterns.gtm_datalayer.search(html_content.lower()):
+        if datalayer_found:
             result.confidence_score += 15
             result.detection_methods.append('DataLayer Detection')
         
@@ -202,13 +482,9 @@ class SingleUrlTagChecker:
                 result.detection_methods.append('Network Request Detection')
                 result.loading_method = 'javascript_execution'
         
-        if result.confidence_score >= 35:
-            result.found = True
-            result.identifiers = list(container_ids)
-        
-        return result
+        return self._finalize(result, 'gtm', container_ids)
     
-    def detect_tealium(self, html_content: str, scripts: List[Dict], 
+    def detect_tealium(self, html_content: str, scripts: List[Dict],
                       network_requests: List[Dict] = None) -> TagDetectionResult:
         """Detect Tealium"""
         result = TagDetectionResult()
@@ -225,19 +501,24 @@ class SingleUrlTagChecker:
                     result.loading_method = 'direct_script'
         
         if account_info:
-            result.identifiers = list(account_info)
             result.detection_methods.append('Script URL Detection')
         
         # utag_data detection
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if self.patterns.tealium_utag_data.search(all_scripts):
+        utag_data_found = False
+        function_matches = 0
+        for match in self._scan_scripts(scripts, self.patterns.tealium_combined):
+            if match.lastgroup == 'data':
+                utag_data_found = True
+            else:
+                function_matches += 1
+        
+        if utag_data_found:
             result.confidence_score += 25
             result.detection_methods.append('utag_data Variable')
         
         # Function calls
-        function_matches = self.patterns.tealium_functions.findall(all_scripts)
         if function_matches:
-            result.confidence_score += len(function_matches) * 3
+            result.confidence_score += function_matches * 3
             result.detection_methods.append('Tealium Functions')
         
         # Network requests
@@ -248,12 +529,9 @@ class SingleUrlTagChecker:
                 result.confidence_score += 50
                 result.detection_methods.append('Network Request Detection')
         
-        if result.confidence_score >= 30:
-            result.found = True
-        
-        return result
+        return self._finalize(result, 'tealium', account_info)
     
-    def detect_gtag(self, html_content: str, scripts: List[Dict], 
+    def detect_gtag(self, html_content: str, scripts: List[Dict],
                    network_requests: List[Dict] = None) -> TagDetectionResult:
         """Detect gtag"""
         result = TagDetectionResult()
@@ -266,7 +544,6 @@ class SingleUrlTagChecker:
             result.confidence_score += 40
         
         if measurement_ids:
-            result.identifiers = list(measurement_ids)
             result.detection_methods.append('Measurement ID Detection')
         
         # Script URL detection
@@ -281,18 +558,13 @@ class SingleUrlTagChecker:
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if self.patterns.gtag_function.search(all_scripts):
+        if any(self._scan_scripts(scripts, self.patterns.gtag_function)):
             result.confidence_score += 20
             result.detection_methods.append('Gtag Function Calls')
         
-        if result.confidence_score >= 30:
-            result.found = True
-            result.identifiers = list(measurement_ids)
-        
-        return result
+        return self._finalize(result, 'gtag', measurement_ids)
     
-    def detect_meta_pixel(self, html_content: str, scripts: List[Dict], 
+    def detect_meta_pixel(self, html_content: str, scripts: List[Dict],
                          network_requests: List[Dict] = None) -> TagDetectionResult:
         """Detect Meta Pixel"""
         result = TagDetectionResult()
@@ -305,7 +577,6 @@ class SingleUrlTagChecker:
             result.confidence_score += 40
         
         if pixel_ids:
-            result.identifiers = list(pixel_ids)
             result.detection_methods.append('Pixel ID Detection')
         
         # Script URL detection
@@ -317,8 +588,7 @@ class SingleUrlTagChecker:
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if self.patterns.meta_pixel_function.search(all_scripts):
+        if any(self._scan_scripts(scripts, self.patterns.meta_pixel_function)):
             result.confidence_score += 20
             result.detection_methods.append('Meta Pixel Function Calls')
         
@@ -330,13 +600,9 @@ class SingleUrlTagChecker:
                 result.confidence_score += 50
                 result.detection_methods.append('Network Request Detection')
         
-        if result.confidence_score >= 30:
-            result.found = True
-            result.identifiers = list(pixel_ids)
-        
-        return result
+        return self._finalize(result, 'meta_pixel', pixel_ids)
     
-    def detect_tiktok_pixel(self, html_content: str, scripts: List[Dict], 
+    def detect_tiktok_pixel(self, html_content: str, scripts: List[Dict],
                            network_requests: List[Dict] = None) -> TagDetectionResult:
         """Detect TikTok Pixel"""
         result = TagDetectionResult()
@@ -349,7 +615,6 @@ class SingleUrlTagChecker:
             result.confidence_score += 40
         
         if pixel_ids:
-            result.identifiers = list(pixel_ids)
             result.detection_methods.append('Pixel ID Detection')
         
         # Script URL detection
@@ -361,8 +626,7 @@ class SingleUrlTagChecker:
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if self.patterns.tiktok_function.search(all_scripts):
+        if any(self._scan_scripts(scripts, self.patterns.tiktok_function)):
             result.confidence_score += 20
             result.detection_methods.append('TikTok Function Calls')
         
@@ -374,32 +638,22 @@ class SingleUrlTagChecker:
                 result.confidence_score += 50
                 result.detection_methods.append('Network Request Detection')
         
-        if result.confidence_score >= 30:
-            result.found = True
-            result.identifiers = list(pixel_ids)
-        
-        return result
+        return self._finalize(result, 'tiktok_pixel', pixel_ids)
     
-    def detect_linkedin_insight(self, html_content: str, scripts: List[Dict], 
+    def detect_linkedin_insight(self, html_content: str, scripts: List[Dict],
                                network_requests: List[Dict] = None) -> TagDetectionResult:
         """Detect LinkedIn Insight Tag"""
         result = TagDetectionResult()
         
         # Partner ID detection
+        # Collect-URL (+40) and function-based (+35) partner IDs in one pass
         partner_ids = set()
-        for match in self.patterns.linkedin_partner_id.finditer(html_content):
-            partner_id = match.group(1)
+        for match in self.patterns.linkedin_combined.finditer(html_content):
+            partner_id = match.group(match.lastgroup)
             partner_ids.add(partner_id)
-            result.confidence_score += 40
-        
-        # Function-based partner ID detection
-        for match in self.patterns.linkedin_function.finditer(html_content):
-            partner_id = match.group(1)
-            partner_ids.add(partner_id)
-            result.confidence_score += 35
+            result.confidence_score += 40 if match.lastgroup == 'pid' else 35
         
         if partner_ids:
-            result.identifiers = list(partner_ids)
             result.detection_methods.append('Partner ID Detection')
         
         # Script URL detection
@@ -418,13 +672,9 @@ class SingleUrlTagChecker:
                 result.confidence_score += 50
                 result.detection_methods.append('Network Request Detection')
         
-        if result.confidence_score >= 30:
-            result.found = True
-            result.identifiers = list(partner_ids)
-        
-        return result
+        return self._finalize(result, 'linkedin_insight', partner_ids)
     
-    def detect_snap_pixel(self, html_content: str, scripts: List[Dict], 
+    def detect_snap_pixel(self, html_content: str, scripts: List[Dict],
                          network_requests: List[Dict] = None) -> TagDetectionResult:
         """Detect Snap Pixel"""
         result = TagDetectionResult()
@@ -437,7 +687,6 @@ class SingleUrlTagChecker:
             result.confidence_score += 40
         
         if pixel_ids:
-            result.identifiers = list(pixel_ids)
             result.detection_methods.append('Pixel ID Detection')
         
         # Script URL detection
@@ -449,8 +698,7 @@ class SingleUrlTagChecker:
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if self.patterns.snap_function.search(all_scripts):
+        if any(self._scan_scripts(scripts, self.patterns.snap_function)):
             result.confidence_score += 20
             result.detection_methods.append('Snap Function Calls')
         
@@ -462,13 +710,9 @@ class SingleUrlTagChecker:
                 result.confidence_score += 50
                 result.detection_methods.append('Network Request Detection')
         
-        if result.confidence_score >= 30:
-            result.found = True
-            result.identifiers = list(pixel_ids)
-        
-        return result
+        return self._finalize(result, 'snap_pixel', pixel_ids)
     
-    def detect_universal_analytics(self, html_content: str, scripts: List[Dict], 
+    def detect_universal_analytics(self, html_content: str, scripts: List[Dict],
                                   network_requests: List[Dict] = None) -> TagDetectionResult:
         """Detect Universal Analytics"""
         result = TagDetectionResult()
@@ -481,7 +725,6 @@ class SingleUrlTagChecker:
             result.confidence_score += 40
         
         if tracking_ids:
-            result.identifiers = list(tracking_ids)
             result.detection_methods.append('Tracking ID Detection')
         
         # Script URL detection
@@ -493,10 +736,9 @@ class SingleUrlTagChecker:
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        function_matches = self.patterns.ua_function.findall(all_scripts)
+        function_matches = sum(1 for _ in self._scan_scripts(scripts, self.patterns.ua_function))
         if function_matches:
-            result.confidence_score += len(function_matches) * 5
+            result.confidence_score += function_matches * 5
             result.detection_methods.append('GA Function Calls')
         
         # Network requests
@@ -507,69 +749,234 @@ class SingleUrlTagChecker:
                 result.confidence_score += 50
                 result.detection_methods.append('Network Request Detection')
         
-        if result.confidence_score >= 35:
-            result.found = True
-            result.identifiers = list(tracking_ids)
-        
-        return result
+        return self._finalize(result, 'universal_analytics', tracking_ids)
+    
+    async def _get_browser_context(self):
+        """Lazily start Playwright and return the shared browser context"""
+        async with self._browser_lock:
+            if self._context is None:
+                try:
+                    self._playwright = await async_playwright().start()
+                    self._browser = await self._playwright.chromium.launch(headless=True)
+                    context = await self._browser.new_context(user_agent=self.user_agent)
+                    
+                    # Block images, stylesheets, fonts and media by resource type for faster loading
+                    await context.route("**/*", self._block_assets)
+                    self._context = context
+                except BaseException:
+                    # A failed or cancelled start must not leave a half-started browser behind,
+                    # or the next call would start a second Playwright and leak the first
+                    try:
+                        await self.aclose()
+                    except Exception:
+                        pass
+                    raise
+        return self._context
+    
+    @staticmethod
+    async def _block_assets(route):
+        """Abort requests for assets that never carry tags"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def aclose(self):
+        """Close the shared browser and Playwright instance"""
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = None
+        self._browser = None
+        self._context = None
     
     async def execute_javascript(self, url: str) -> Dict[str, Any]:
         """Execute JavaScript and capture network requests"""
         if not self.use_javascript:
             return {'network_requests': [], 'console_logs': [], 'final_dom': ''}
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(user_agent=self.user_agent)
-            
-            # Block images and stylesheets for faster loading
-            await context.route("**/*.{png,jpg,jpeg,gif,svg,css,woff,woff2}", 
-                              lambda route: route.abort())
-            
-            page = await context.new_page()
+        context = await self._get_browser_context()
+        page = await context.new_page()
+        
+        # Track network requests and console logs
+        tag_requests = []
+        console_logs = []
+        
+        async def handle_request(request):
+            if any(domain in request.url for domain in self.patterns.tag_domains):
+                tag_requests.append({
+                    'url': request.url,
+                    'timestamp': time.time(),
+                    'resource_type': request.resource_type
+                })
+        
+        page.on('request', handle_request)
+        page.on('console', lambda msg: console_logs.append(msg.text))
+        
+        try:
+            # Navigate and wait for content
+            await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout * 1000)
+            await page.wait_for_load_state('domcontentloaded')
             
-            # Track network requests and console logs
-            tag_requests = []
-            console_logs = []
+            # Wait a bit for tags to load
+            await page.wait_for_timeout(3000)
             
-            async def handle_request(request):
-                if any(domain in request.url for domain in self.patterns.tag_domains):
-                    tag_requests.append({
-                        'url': request.url,
-                        'timestamp': time.time(),
-                        'resource_type': request.resource_type
-                    })
+            final_dom = await page.content()
             
-            page.on('request', handle_request)
-            page.on('console', lambda msg: console_logs.append(msg.text))
+            return {
+                'network_requests': tag_requests,
+                'console_logs': console_logs,
+                'final_dom': final_dom
+            }
+        
+        except Exception as e:
+            print(f"JavaScript execution error: {str(e)}")
+            return {
+                'network_requests': tag_requests,
+                'console_logs': console_logs,
+                'final_dom': ''
+            }
+        finally:
+            await page.close()
+    
+    def find_candidate_detectors(self, html_content: str, network_requests: List[Dict]) -> Set[str]:
+        """Return the detectors whose anchor literals appear in the page or captured requests"""
+        if self._hs_scratch is not None:
+            return self._scan_anchors_hyperscan(html_content, network_requests)
+        
+        text = html_content.lower()
+        if network_requests:
+            text += ' ' + ' '.join(req.get('url', '') for req in network_requests).lower()
+        
+        if self.patterns.anchor_automaton is None:
+            return {detector for detector, anchors in self.patterns.detector_anchors.items()
+                    if any(anchor in text for anchor in anchors)}
+        
+        candidates = set()
+        for _, detectors in self.patterns.anchor_automaton.iter(text):
+            candidates |= detectors
+            if len(candidates) == len(self.patterns.detector_anchors):
+                break
+        return candidates
+    
+    def _scan_anchors_hyperscan(self, html_content: str, network_requests: List[Dict]) -> Set[str]:
+        """Case-insensitive anchor scan over the raw bytes with the shared Hyperscan database"""
+        data = html_content.encode('utf-8', errors='replace')
+        if network_requests:
+            data += b' ' + ' '.join(req.get('url', '') for req in network_requests).encode('utf-8', errors='replace')
+        
+        candidates = set()
+        total = len(self.patterns.detector_anchors)
+        
+        def on_match(pattern_id, start, end, flags, context):
+            candidates.add(self.patterns.anchor_detectors[pattern_id])
+            # Returning True halts the scan once every detector is a candidate
+            return len(candidates) == total
+        
+        try:
+            self.patterns.anchor_database.scan(data, match_event_handler=on_match, scratch=self._hs_scratch)
+        except hyperscan.ScanTerminated:
+            pass
+        return candidates
+    
+    def _static_prescan(self, html_content: str) -> bool:
+        """Return True when the static HTML alone is not conclusive and JavaScript should run"""
+        if (self.patterns.spa_frameworks.search(html_content) or
+                self.patterns.progressive_loading.search(html_content) or
+                self.patterns.consent_managers.search(html_content)):
+            return True
+        
+        id_patterns = (
+            self.patterns.gtm_container_id,
+            self.patterns.tealium_url,
+            self.patterns.gtag_measurement_id,
+            self.patterns.meta_pixel_id,
+            self.patterns.tiktok_pixel_id,
+            self.patterns.linkedin_combined,
+            self.patterns.snap_pixel_id,
+            self.patterns.ua_tracking_id
+        )
+        return not any(pattern.search(html_content) for pattern in id_patterns)
+    
+    def fetch_html(self, url: str) -> Tuple[int, str, bool]:
+        """Stream the page body up to MAX_HTML_BYTES; returns (status code, HTML, truncated)"""
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            if response.status_code != 200:
+                return response.status_code, '', False
             
-            try:
-                # Navigate and wait for content
-                await page.goto(url, wait_until='domcontentloaded', timeout=self.timeout * 1000)
-                await page.wait_for_load_state('domcontentloaded')
-                
-                # Wait a bit for tags to load
-                await page.wait_for_timeout(3000)
-                
-                final_dom = await page.content()
-                
-                return {
-                    'network_requests': tag_requests,
-                    'console_logs': console_logs,
-                    'final_dom': final_dom
-                }
+            chunks = []
+            total = 0
+            truncated = False
+            for chunk in response.iter_content(32768, decode_unicode=False):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_HTML_BYTES:
+                    truncated = True
+                    break
             
-            except Exception as e:
-                print(f"JavaScript execution error: {str(e)}")
-                return {
-                    'network_requests': tag_requests,
-                    'console_logs': console_logs,
-                    'final_dom': ''
-                }
-            finally:
-                await browser.close()
+            raw = b''.join(chunks)
+            return response.status_code, self.decode_body(raw, response.encoding), truncated
+    
+    @staticmethod
+    def decode_body(raw: bytes, encoding: Optional[str]) -> str:
+        """Decode like requests' response.text, detecting the encoding on the bytes read when the
+        headers give none"""
+        if encoding is None:
+            encoding = chardet.detect(raw)['encoding'] if chardet is not None else 'utf-8'
+        try:
+            return str(raw, encoding or 'utf-8', errors='replace')
+        except LookupError:
+            return str(raw, 'utf-8', errors='replace')
+    
+    def _detection_cache_key(self, html_content: str, network_requests: List[Dict]) -> int:
+        """Hash the page body together with the captured tag request URLs"""
+        if XXHASH_AVAILABLE:
+            body_hash = xxhash.xxh3_64_intdigest(html_content.encode('utf-8', errors='replace'))
+        else:
+            body_hash = hash(html_content)
+        return body_hash ^ hash(tuple(sorted(req.get('url', '') for req in network_requests)))
+    
+    async def _run_detectors(self, html_content: str, network_requests: List[Dict]) -> Dict[str, Dict]:
+        """Extract scripts and run every detector, returning results keyed by detector name"""
+        scripts = self.extract_scripts(html_content)
+        
+        # Run all detections
+        detectors = {
+            'gtm': self.detect_gtm,
+            'tealium': self.detect_tealium, 
+            'gtag': self.detect_gtag,
+            'meta_pixel': self.detect_meta_pixel,
+            'tiktok_pixel': self.detect_tiktok_pixel,
+            'linkedin_insight': self.detect_linkedin_insight,
+            'snap_pixel': self.detect_snap_pixel,
+            'universal_analytics': self.detect_universal_analytics
+        }
+        
+        # Only run detectors whose anchor literals occur; the rest report an empty result
+        candidates = self.find_candidate_detectors(html_content, network_requests)
+        detection_results = {}
+        skipped = [name for name in detectors if name not in candidates]
+        for name in skipped:
+            detection_results[name] = TagDetectionResult().to_dict()
+        if 'gtm' in skipped:
+            # detect_gtm also reports the page-level SPA and progressive loading flags,
+            # which do not depend on any GTM anchor
+            detection_results['gtm'] = TagDetectionResult(
+                progressive_loading_detected=self.detect_progressive_loading(html_content),
+                spa_detected=bool(self.patterns.spa_frameworks.search(html_content))
+            ).to_dict()
+        
+        # The event loop's default executor runs them, so there is no pool of our own to shut down
+        results = await asyncio.gather(*(
+            asyncio.to_thread(detectors[name], html_content, scripts, network_requests)
+            for name in candidates
+        ))
+        for name, detection_result in zip(candidates, results):
+            detection_results[name] = detection_result.to_dict()
+        return {name: detection_results[name] for name in detectors}
     
-    def analyze_url(self, url: str) -> Dict[str, Any]:
+    async def analyze_url(self, url: str) -> Dict[str, Any]:
         """Analyze a single URL for all tag types"""
         start_time = time.time()
         
@@ -590,49 +997,46 @@ class SingleUrlTagChecker:
         
         try:
             # Fetch static content
-            response = requests.get(url, headers=self.get_headers(), timeout=self.timeout)
-            result['response_code'] = response.status_code
+            status_code, html_content, truncated = await asyncio.to_thread(self.fetch_html, url)
+            result['response_code'] = status_code
             
-            if response.status_code != 200:
+            if status_code != 200:
                 result['status'] = 'error'
-                result['error'] = f'HTTP {response.status_code}'
+                result['error'] = f'HTTP {status_code}'
                 return result
             
-            html_content = response.text
-            scripts = self.extract_scripts(html_content)
+            if truncated:
+                result['warnings'].append(f'Response truncated to the first {MAX_HTML_BYTES // 1024} KB')
             
-            # Execute JavaScript if enabled
-            if self.use_javascript:
-                js_result = asyncio.run(self.execute_javascript(url))
+            # Skip the browser, including its launch, when the static HTML is already conclusive
+            run_javascript = self.use_javascript
+            if run_javascript and self.static_fast_path and not self._static_prescan(html_content):
+                run_javascript = False
+                result['javascript_executed'] = False
+            
+            if run_javascript:
+                js_result = await self.execute_javascript(url)
                 network_requests = js_result['network_requests']
             else:
                 network_requests = []
             
-            # Run all detections
-            detectors = {
-                'gtm': self.detect_gtm,
-                'tealium': self.detect_tealium, 
-                'gtag': self.detect_gtag,
-                'meta_pixel': self.detect_meta_pixel,
-                'tiktok_pixel': self.detect_tiktok_pixel,
-                'linkedin_insight': self.detect_linkedin_insight,
-                'snap_pixel': self.detect_snap_pixel,
-                'universal_analytics': self.detect_universal_analytics
-            }
-            
-            for name, detector in detectors.items():
-                detection_result = detector(html_content, scripts, network_requests)
-                result['detection_results'][name] = asdict(detection_result)
+            # Identical markup and requests give identical detections
+            cache_key = self._detection_cache_key(html_content, network_requests)
+            cached = self._det_cache.get(cache_key)
+            if cached is not None:
+                self._det_cache.move_to_end(cache_key)
+                result['detection_results'] = deepcopy(cached)
+            else:
+                result['detection_results'] = await self._run_detectors(html_content, network_requests)
+                self._det_cache[cache_key] = deepcopy(result['detection_results'])
+                if len(self._det_cache) > DETECTION_CACHE_SIZE:
+                    self._det_cache.popitem(last=False)
             
             # Add warnings
             if self.patterns.consent_managers.search(html_content):
                 result['warnings'].append('Consent management detected - tags may load after user interaction')
             
-            progressive_detected = any(
-                result['detection_results'][name]['progressive_loading_detected'] 
-                for name in detectors.keys()
-            )
-            if progressive_detected:
+            if self.detect_progressive_loading(html_content):
                 result['warnings'].append('Progressive loading detected - some tags may load dynamically')
             
             result['load_time'] = round(time.time() - start_time, 2)
@@ -643,11 +1047,120 @@ class SingleUrlTagChecker:
             result['load_time'] = round(time.time() - start_time, 2)
         
         return result
+    
+    def analyze_url_sync(self, url: str) -> Dict[str, Any]:
+        """Synchronous entry point for analyze_url"""
+        async def run():
+            try:
+                return await self.analyze_url(url)
+            finally:
+                # The browser is bound to this event loop, so shut it down with it
+                await self.aclose()
+        
+        return asyncio.run(run())
+
+def to_json(result: Dict[str, Any], indent: bool = False) -> bytes:
+    """Serialize an analysis result to UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(result, option=option)
+    return json.dumps(result, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+# Result fields that change on every run without the detections changing
+VOLATILE_EXPORT_FIELDS = frozenset({'load_time'})
+
+def _export_digest(result: Dict[str, Any]) -> str:
+    """blake2b digest of the exported JSON minus volatile fields, hashed chunk by chunk on the stdlib path"""
+    result = {key: value for key, value in result.items() if key not in VOLATILE_EXPORT_FIELDS}
+    hasher = hashlib.blake2b(digest_size=16)
+    if ORJSON_AVAILABLE:
+        hasher.update(to_json(result, indent=True))
+    else:
+        for chunk in json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(result):
+            hasher.update(chunk.encode('utf-8'))
+    return hasher.hexdigest()
+
+def export_results(result: Dict[str, Any], filename: str, hash_file: Optional[str] = None) -> bool:
+    """Write an analysis result to a JSON file; returns False when skipped as unchanged.
+    
+    With hash_file set (a sidecar belonging to filename alone), the export is skipped if
+    filename exists and the digest recorded there by its last export still matches, and
+    the new digest is recorded otherwise. load_time is left out of the digest.
+    """
+    digest = None
+    if hash_file:
+        digest = _export_digest(result)
+        if os.path.exists(filename):
+            try:
+                with open(hash_file, 'r', encoding='utf-8') as f:
+                    if f.read().strip() == digest:
+                        return False
+            except OSError:
+                pass
+    
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb', buffering=1 << 20) as f:
+            f.write(to_json(result, indent=True))
+    else:
+        # Stream the encoder's chunks instead of building the whole document first
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        with open(filename, 'w', encoding='utf-8', newline='\n', buffering=1 << 20) as f:
+            f.writelines(encoder.iterencode(result))
+    
+    if digest:
+        # Write then rename so a crash never leaves a partial hash behind
+        tmp_file = hash_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(digest)
+        os.replace(tmp_file, hash_file)
+    return True
+
+def _join_values(values) -> str:
+    """Comma-join a list, skipping the join for a single item; pre-joined strings pass through"""
+    if isinstance(values, str):
+        return values
+    return values[0] if len(values) == 1 else ', '.join(values)
+
+def _format_detection(name: str, d: Dict[str, Any]) -> str:
+    """Render one tag's report block as a single string"""
+    g = d.get
+    if not g('found', False):
+        return f"\n✗ {name}: NOT DETECTED\n"
+    
+    identifiers = g('identifiers')
+    methods = g('detection_methods')
+    checks = g('verification_checks')
+    loading_method = g('loading_method')
+    
+    lines = [f"\n✓ {name}: DETECTED\n", f"  Confidence Score: {g('confidence_score', 0)}\n"]
+    
+    if identifiers:
+        lines.append(f"  Identifiers: {_join_values(identifiers)}\n")
+    
+    if methods:
+        lines.append(f"  Detection Methods: {_join_values(methods)}\n")
+    
+    if checks:
+        lines.append(f"  Verification: {_join_values(checks)}\n")
+    
+    if loading_method != 'unknown':
+        lines.append(f"  Loading Method: {loading_method}\n")
+    
+    return ''.join(lines)
 
 def main():
     """Main function for testing a single URL"""
+    parser = argparse.ArgumentParser(description="Detect marketing and analytics tags on a single URL")
+    parser.add_argument('url', nargs='?', help="URL to analyze (prompted for when omitted)")
+    parser.add_argument('--export', action=argparse.BooleanOptionalAction, default=None,
+                        help="Export results to JSON (default: ask on a terminal, export otherwise)")
+    parser.add_argument('-o', '--output', help="Path of the exported JSON file")
+    args = parser.parse_args()
+    
     # Configuration
-    test_url = input("Enter URL to analyze: ").strip()
+    test_url = args.url or input("Enter URL to analyze: ").strip()
     if not test_url:
         test_url = "https://en.gacmotorsaudi.com/checkoutnew/"
     
@@ -659,16 +1172,18 @@ def main():
     print("-" * 60)
     
     # Analyze URL
-    result = checker.analyze_url(test_url)
+    result = checker.analyze_url_sync(test_url)
     
-    # Display results
-    print(f"\nStatus: {result['status']}")
-    print(f"Response Code: {result['response_code']}")
-    print(f"Load Time: {result['load_time']}s")
+    # Display results (collected and written in one go)
+    out = []
+    w = out.append
+    w(f"\nStatus: {result['status']}\n")
+    w(f"Response Code: {result['response_code']}\n")
+    w(f"Load Time: {result['load_time']}s\n")
     
     if result['status'] == 'success':
-        print("\nTag Detection Results:")
-        print("=" * 60)
+        w("\nTag Detection Results:\n")
+        w(_SEP + "\n")
         
         tag_names = {
             'gtm': 'Google Tag Manager',
@@ -682,44 +1197,37 @@ def main():
         }
         
         for tag_key, tag_name in tag_names.items():
-            detection = result['detection_results'].get(tag_key, {})
-            
-            if detection.get('found', False):
-                print(f"\n✓ {tag_name}: DETECTED")
-                print(f"  Confidence Score: {detection.get('confidence_score', 0)}")
-                
-                if detection.get('identifiers'):
-                    print(f"  Identifiers: {', '.join(detection['identifiers'])}")
-                
-                if detection.get('detection_methods'):
-                    print(f"  Detection Methods: {', '.join(detection['detection_methods'])}")
-                
-                if detection.get('verification_checks'):
-                    print(f"  Verification: {', '.join(detection['verification_checks'])}")
-                
-                if detection.get('loading_method') != 'unknown':
-                    print(f"  Loading Method: {detection['loading_method']}")
-            else:
-                print(f"\n✗ {tag_name}: NOT DETECTED")
+            w(_format_detection(tag_name, result['detection_results'].get(tag_key, {})))
         
         # Display warnings
         if result['warnings']:
-            print("\n" + "=" * 60)
-            print("Warnings:")
-            for warning in result['warnings']:
-                print(f"  ⚠ {warning}")
+            w(_SEP_LINE + "\n")
+            w("Warnings:\n")
+            w("\n".join(f"  ⚠ {warning}" for warning in result['warnings']))
+            w("\n")
     
     else:
-        print(f"\nError: {result['error']}")
+        w(f"\nError: {result['error']}\n")
+    
+    sys.stdout.write("".join(out))
     
     # Export to JSON
-    print("\n" + "=" * 60)
-    export = input("\nExport results to JSON? (y/n): ").strip().lower()
+    print(_SEP_LINE)
+    # --export/--no-export or TAG_EXPORT=y|n decide up front; only a terminal gets the prompt
+    if args.export is not None:
+        export = 'y' if args.export else 'n'
+    else:
+        export = os.environ.get('TAG_EXPORT', '').strip().lower()
+        if not export:
+            export = input("\nExport results to JSON? (y/n): ").strip().lower() if sys.stdin.isatty() else 'y'
     if export == 'y':
-        filename = f"tag_detection_{int(time.time())}.json"
-        with open(filename, 'w') as f:
-            json.dump(result, f, indent=2)
-        print(f"Results exported to {filename}")
+        filename = args.output or f"tag_detection_{time.time_ns()}.json"
+        # A fresh timestamped file never matches an earlier export, so only -o keeps a digest
+        hash_file = args.output + '.hash' if args.output else None
+        if export_results(result, filename, hash_file):
+            print(f"Results exported to {filename}")
+        else:
+            print("Results unchanged since the last export, skipped")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,21 +1,24 @@
 import asyncio
 import re
 import csv
-import json
-import hashlib
 import time
-import unittest
 import random
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Set, Optional, Tuple, Any, Pattern
-from urllib.parse import urlparse, urljoin
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields
+from collections import defaultdict, OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Set, Optional, Tuple, Any
+from urllib.parse import urlparse
+from html import unescape
 import logging
 
 # Core dependencies
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 # Headless browser dependencies 
 try:
@@ -24,71 +27,329 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     print("Warning: Playwright not installed. JavaScript execution disabled.")
+
+# Async HTTP client (optional, fetches pages on the event loop)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Aho-Corasick multi-literal matcher (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# lxml HTML parser (optional, C parser)
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+SCRIPT_STRAINER = SoupStrainer('script')
+
+# <script> elements and their attributes, scanned directly when lxml is not installed;
+# comments are matched too so that commented-out scripts can be skipped
+SCRIPT_OPEN_TAG = re.compile(r'<!--.*?-->|(<script\b)', re.IGNORECASE | re.DOTALL)
+SCRIPT_ELEMENT = re.compile(r'<!--.*?-->|<script\b((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>(.*?)</script\s*>',
+                            re.IGNORECASE | re.DOTALL)
+SCRIPT_ATTRIBUTE = re.compile(r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+)))?')
+
+# Unpaired UTF-16 surrogates, which the browser can hand back in page content
+LONE_SURROGATE = re.compile(r'[\ud800-\udfff]')
+
+# Hyperscan multi-pattern scanner (optional)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# RE2 regex engine (optional, linear-time DFA)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# xxHash for hashing page bodies (optional)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+def thread_scratch(database, local: threading.local):
+    """The calling thread's Hyperscan scratch for database; concurrent scans cannot share one"""
+    scratch = getattr(local, 'scratch', None)
+    if scratch is None:
+        scratch = local.scratch = hyperscan.Scratch(database)
+    return scratch
+
+# Python's Unicode \s, \d and \w as RE2 class contents; RE2's own shorthand classes are ASCII-only
+RE2_CLASS_BODIES = {
+    's': r'\t-\r\x1c-\x20\x85\xa0\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}',
+    'd': r'\p{Nd}',
+    'w': r'\p{L}\p{N}_'
+}
+
+# Characters that re.IGNORECASE matches against ASCII letters but RE2's case folding does not
+RE2_MISSING_FOLDS = ('\u0130', '\u0131')
+
+# The same for Hyperscan, whose caseless matching only folds ASCII letters
+HYPERSCAN_MISSING_FOLDS = ('\u0130', '\u0131', '\u017f', '\u212a')
+
+# Bounded [\s\S]{0,N} gaps, which Hyperscan counts in bytes and compiles slowly in UTF-8 mode
+BOUNDED_GAP = re.compile(r'\[\\s\\S\]\{0,\d+\}')
+
+# The Python source of every pattern compiled with RE2, keyed by its rewritten form
+PATTERN_SOURCES: Dict[str, str] = {}
+
+def re2_pattern(pattern: str, flags: int = 0, missing_folds: Tuple[str, ...] = RE2_MISSING_FOLDS) -> Optional[str]:
+    """Rewrite a Python pattern so that RE2 matches exactly what re matches on str.
+    
+    Shorthand classes are spelled out with their Unicode members, and letters get the extra
+    case variants re.IGNORECASE accepts that the engine does not (missing_folds). None when
+    the pattern uses a construct that cannot be rewritten (word boundaries, negated
+    shorthands inside a class). Hyperscan in UTF-8 mode takes the same syntax.
+    """
+    ignorecase = bool(flags & re.IGNORECASE)
+    pattern = pattern.replace(r'[\s\S]', '.' if flags & re.DOTALL else '(?s:.)')
+    out = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i + 1:i + 2]
+            if escape in RE2_CLASS_BODIES:
+                out.append(f'[{RE2_CLASS_BODIES[escape]}]')
+            elif escape.lower() in RE2_CLASS_BODIES:
+                out.append(f'[^{RE2_CLASS_BODIES[escape.lower()]}]')
+            elif escape in ('b', 'B'):
+                return None
+            else:
+                out.append(pattern[i:i + 2])
+            i += 2
+        elif pattern.startswith('(?P<', i):
+            # Group names are copied as they are
+            end = pattern.index('>', i) + 1
+            out.append(pattern[i:end])
+            i = end
+        elif char == '[':
+            end = i + 1
+            negated = pattern.startswith('^', end)
+            if negated:
+                end += 1
+            body = [pattern[i + 1:end]]
+            if pattern.startswith(']', end):
+                body.append(']')
+                end += 1
+            while pattern[end] != ']':
+                if pattern[end] == '\\':
+                    escape = pattern[end + 1:end + 2]
+                    if escape in RE2_CLASS_BODIES:
+                        body.append(RE2_CLASS_BODIES[escape])
+                    elif escape.lower() in RE2_CLASS_BODIES or escape in ('b', 'B'):
+                        return None
+                    else:
+                        body.append(pattern[end:end + 2])
+                    end += 2
+                else:
+                    body.append(pattern[end])
+                    end += 1
+            end += 1
+            if ignorecase:
+                python_class = re.compile(pattern[i:end], flags)
+                # A negated class must exclude the variants re excludes
+                body.extend(f'\\x{{{ord(fold):x}}}' for fold in missing_folds
+                            if bool(python_class.fullmatch(fold)) != negated)
+            out.append('[' + ''.join(body) + ']')
+            i = end
+        elif ignorecase and char.isalpha() and char.isascii():
+            folds = [fold for fold in missing_folds if re.fullmatch(re.escape(char), fold, flags)]
+            out.append(f'[{char}' + ''.join(f'\\x{{{ord(fold):x}}}' for fold in folds) + ']' if folds else char)
+            i += 1
+        else:
+            out.append(char)
+            i += 1
+    return ''.join(out)
+
+@lru_cache(maxsize=None)
+def compile_pattern(pattern: str, flags: int = 0):
+    """Compile a pattern with RE2 when available and it can match what re matches, else with re"""
+    if RE2_AVAILABLE:
+        rewritten = re2_pattern(pattern, flags)
+        if rewritten is not None:
+            options = re2.Options()
+            options.case_sensitive = not flags & re.IGNORECASE
+            options.dot_nl = bool(flags & re.DOTALL)
+            PATTERN_SOURCES[rewritten] = pattern
+            return re2.compile(rewritten, options)
+    return re.compile(pattern, flags)
+
+def pattern_source(compiled) -> str:
+    """The Python source of a compiled pattern, whichever engine compiled it"""
+    return PATTERN_SOURCES.get(compiled.pattern, compiled.pattern)
+
+def hyperscan_expression(pattern: str) -> Optional[bytes]:
+    """A UTF-8 mode Hyperscan expression that matches wherever re matches pattern, caselessly.
+    
+    Classes get the same Unicode rewrite as for RE2. Bounded gaps become unbounded, so the
+    expression may also match where re does not; it only gates the re search. None when
+    the pattern cannot be rewritten.
+    """
+    expression = re2_pattern(BOUNDED_GAP.sub(r'[\\s\\S]*', pattern), re.IGNORECASE | re.DOTALL,
+                             HYPERSCAN_MISSING_FOLDS)
+    return None if expression is None else expression.encode()
+
+def without_lone_surrogates(text: str) -> str:
+    """text with unpaired UTF-16 surrogates (from page scripts, via the browser) replaced by U+FFFD.
+    
+    RE2 and Hyperscan only take valid UTF-8, so one such character would fail the whole page.
+    """
+    if not LONE_SURROGATE.search(text):
+        return text
+    return text.encode('utf-16-le', 'surrogatepass').decode('utf-16-le', 'replace')
+
+def compile_keyword_lookahead(keyword_owners: Dict[str, Set[str]]) -> Tuple[Any, Dict[str, frozenset]]:
+    """One regex of lookaheads reporting a keyword at every position it occurs, plus each keyword's owners.
+    
+    The longest keyword at a position wins the alternation, so its owners also include the
+    owners of the keywords it starts with.
+    """
+    keywords = sorted(keyword_owners, key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in keywords) + '))')
+    owners = {
+        keyword: frozenset(owner for prefix, prefix_owners in keyword_owners.items()
+                           if keyword.startswith(prefix) for owner in prefix_owners)
+        for keyword in keywords
+    }
+    return pattern, owners
+
+@lru_cache(maxsize=None)
+def compile_signature_database(signatures: Tuple[str, ...]):
+    """Caseless single-match Hyperscan database over literal signatures; pattern ids index signatures.
+    
+    Cached so every tagchecker with the same plugins shares one compiled database.
+    """
+    expressions = [re.escape(signature).encode() for signature in signatures]
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions)
+    )
+    return database
+
 # Compiled regex patterns for performance
 class CompiledPatterns:
+    # Every compiled pattern; slots keep the per-URL attribute lookups off an instance dict
+    __slots__ = (
+        'gtm_container_id', 'gtm_script_url', 'gtm_init_code', 'gtm_datalayer', 'gtm_noscript',
+        'gtm_dynamic', 'tealium_url', 'tealium_utag_data', 'tealium_async', 'tealium_functions',
+        'tealium_dynamic', 'gtag_measurement_id', 'gtag_script_url', 'gtag_function', 'meta_pixel_id',
+        'meta_pixel_script_url', 'meta_pixel_noscript', 'meta_pixel_function', 'meta_pixel_dynamic',
+        'tiktok_pixel_id', 'tiktok_script_url', 'tiktok_noscript', 'tiktok_function', 'tiktok_dynamic',
+        'linkedin_partner_id', 'linkedin_script_url', 'linkedin_noscript', 'linkedin_function',
+        'linkedin_dynamic', 'snap_pixel_id', 'snap_script_url', 'snap_noscript', 'snap_function',
+        'snap_dynamic', 'ua_tracking_id', 'ua_script_url', 'ua_function', 'ua_dynamic',
+        'consent_managers', 'lazy_loading', 'late_loading', 'spa_frameworks', 'progressive_loading',
+        'gtm_container_id_lc', 'gtm_datalayer_lc', 'gtm_noscript_lc', 'tealium_async_lc',
+        'gtag_measurement_id_lc', 'meta_pixel_id_lc', 'meta_pixel_noscript_lc', 'tiktok_pixel_id_lc',
+        'tiktok_noscript_lc', 'linkedin_partner_id_lc', 'linkedin_function_lc', 'linkedin_noscript_lc',
+        'snap_pixel_id_lc', 'snap_noscript_lc', 'ua_tracking_id_lc', 'create_element', 'script_host',
+        'tag_domains'
+    )
+    
     def __init__(self):
         # GTM regex patterns
-        self.gtm_container_id = re.compile(r'GTM-[A-Z0-9]{4,}', re.IGNORECASE)
-        self.gtm_script_url = re.compile(r'https://www\.googletagmanager\.com/gtm\.js\?id=([^&"\'\s]+)', re.IGNORECASE)
-        self.gtm_init_code = re.compile(r'gtm\.start["\']?\s*:\s*new\s+Date\(\)\.getTime\(\)', re.IGNORECASE | re.DOTALL)
-        self.gtm_datalayer = re.compile(r'dataLayer\s*=\s*\[|dataLayer\.push\s*\(', re.IGNORECASE)
-        self.gtm_noscript = re.compile(r'<noscript>.*?<iframe[^>]*src=["\']https://www\.googletagmanager\.com/ns\.html\?id=([^"\'&]+)', re.IGNORECASE | re.DOTALL)
-        self.gtm_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?googletagmanager\.com/gtm\.js', re.IGNORECASE | re.DOTALL)
+        self.gtm_container_id = compile_pattern(r'GTM-[A-Z0-9]{4,}', re.IGNORECASE)
+        self.gtm_script_url = compile_pattern(r'https://www\.googletagmanager\.com/gtm\.js\?id=([^&"\'\s]+)', re.IGNORECASE)
+        self.gtm_init_code = compile_pattern(r'gtm\.start["\']?\s*:\s*new\s+Date\(\)\.getTime\(\)', re.IGNORECASE | re.DOTALL)
+        self.gtm_datalayer = compile_pattern(r'dataLayer\s*=\s*\[|dataLayer\.push\s*\(', re.IGNORECASE)
+        self.gtm_noscript = compile_pattern(r'<noscript>.*?<iframe[^>]*src=["\']https://www\.googletagmanager\.com/ns\.html\?id=([^"\'&]+)', re.IGNORECASE | re.DOTALL)
+        self.gtm_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?googletagmanager\.com/gtm\.js', re.IGNORECASE | re.DOTALL)
         
         # Tealium Patterns
-        self.tealium_url = re.compile(r'https://tags\.tiqcdn\.com/utag/([^/]+)/([^/]+)/([^/]+)/utag\.js', re.IGNORECASE)
-        self.tealium_utag_data = re.compile(r'var\s+utag_data\s*=\s*\{|utag_data\s*=\s*\{', re.IGNORECASE)
-        self.tealium_async = re.compile(r'\(function\s*\([a-z,\s]*\)\s*\{[^}]*tags\.tiqcdn\.com[^}]*\}\s*\)\s*\(\s*\)', re.IGNORECASE | re.DOTALL)
-        self.tealium_functions = re.compile(r'utag\.(link|view|track|sync)\s*\(', re.IGNORECASE)
-        self.tealium_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,300}?tags\.tiqcdn\.com', re.IGNORECASE | re.DOTALL)
+        self.tealium_url = compile_pattern(r'https://tags\.tiqcdn\.com/utag/([^/]+)/([^/]+)/([^/]+)/utag\.js', re.IGNORECASE)
+        self.tealium_utag_data = compile_pattern(r'var\s+utag_data\s*=\s*\{|utag_data\s*=\s*\{', re.IGNORECASE)
+        self.tealium_async = compile_pattern(r'\(function\s*\([a-z,\s]*\)\s*\{[^}]*tags\.tiqcdn\.com[^}]*\}\s*\)\s*\(\s*\)', re.IGNORECASE | re.DOTALL)
+        self.tealium_functions = compile_pattern(r'utag\.(link|view|track|sync)\s*\(', re.IGNORECASE)
+        self.tealium_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,300}?tags\.tiqcdn\.com', re.IGNORECASE | re.DOTALL)
         
         # gtag Patterns
-        self.gtag_measurement_id = re.compile(r'G-[A-Z0-9]{10}', re.IGNORECASE)
-        self.gtag_script_url = re.compile(r'https://www\.googletagmanager\.com/gtag/js\?id=([^&"\'\s]+)', re.IGNORECASE)
-        self.gtag_function = re.compile(r'gtag\s*\(\s*["\']config["\']|gtag\s*\(\s*["\']event["\']', re.IGNORECASE)
+        self.gtag_measurement_id = compile_pattern(r'G-[A-Z0-9]{10}', re.IGNORECASE)
+        self.gtag_script_url = compile_pattern(r'https://www\.googletagmanager\.com/gtag/js\?id=([^&"\'\s]+)', re.IGNORECASE)
+        self.gtag_function = compile_pattern(r'gtag\s*\(\s*["\']config["\']|gtag\s*\(\s*["\']event["\']', re.IGNORECASE)
 
         # Meta Pixel Patterns
-        self.meta_pixel_id = re.compile(r'fbq\s*\(\s*["\']init["\']\s*,\s*["\'](\d{15,16})["\']', re.IGNORECASE)
-        self.meta_pixel_script_url = re.compile(r'https://connect\.facebook\.net/[^/]+/fbevents\.js', re.IGNORECASE)
-        self.meta_pixel_noscript = re.compile(r'<noscript>.*?<img[^>]*src=["\']https://www\.facebook\.com/tr\?id=(\d{15,16})', re.IGNORECASE | re.DOTALL)
-        self.meta_pixel_function = re.compile(r'fbq\s*\(\s*["\']track["\']\s*,', re.IGNORECASE)
-        self.meta_pixel_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?connect\.facebook\.net', re.IGNORECASE | re.DOTALL)
+        self.meta_pixel_id = compile_pattern(r'fbq\s*\(\s*["\']init["\']\s*,\s*["\'](\d{15,16})["\']', re.IGNORECASE)
+        self.meta_pixel_script_url = compile_pattern(r'https://connect\.facebook\.net/[^/]+/fbevents\.js', re.IGNORECASE)
+        self.meta_pixel_noscript = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://www\.facebook\.com/tr\?id=(\d{15,16})', re.IGNORECASE | re.DOTALL)
+        self.meta_pixel_function = compile_pattern(r'fbq\s*\(\s*["\']track["\']\s*,', re.IGNORECASE)
+        self.meta_pixel_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?connect\.facebook\.net', re.IGNORECASE | re.DOTALL)
 
         # TikTok Pixel Patterns
-        self.tiktok_pixel_id = re.compile(r'ttq\.load\s*\(\s*["\']([^"\']+)["\']', re.IGNORECASE)
-        self.tiktok_script_url = re.compile(r'https://analytics\.tiktok\.com/i18n/pixel/events\.js', re.IGNORECASE)
-        self.tiktok_noscript = re.compile(r'<noscript>.*?<img[^>]*src=["\']https://analytics\.tiktok\.com/i18n/pixel/pixel\.gif\?id=([^"\']+)', re.IGNORECASE | re.DOTALL)
-        self.tiktok_function = re.compile(r'ttq\.track\s*\(\s*["\']([^"\']+)["\']', re.IGNORECASE)
-        self.tiktok_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?analytics\.tiktok\.com', re.IGNORECASE | re.DOTALL)
+        self.tiktok_pixel_id = compile_pattern(r'ttq\.load\s*\(\s*["\']([^"\']+)["\']', re.IGNORECASE)
+        self.tiktok_script_url = compile_pattern(r'https://analytics\.tiktok\.com/i18n/pixel/events\.js', re.IGNORECASE)
+        self.tiktok_noscript = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://analytics\.tiktok\.com/i18n/pixel/pixel\.gif\?id=([^"\']+)', re.IGNORECASE | re.DOTALL)
+        self.tiktok_function = compile_pattern(r'ttq\.track\s*\(\s*["\']([^"\']+)["\']', re.IGNORECASE)
+        self.tiktok_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?analytics\.tiktok\.com', re.IGNORECASE | re.DOTALL)
 
         # LinkedIn Insight Tag Patterns
-        self.linkedin_partner_id = re.compile(r'linkedin\.com\/collect\?pid=(\d+)', re.IGNORECASE)
-        self.linkedin_script_url = re.compile(r'https://snap.licdn.com/li.lms-analytics/insight\.min\.js', re.IGNORECASE)
-        self.linkedin_noscript = re.compile(r'<noscript>.*?<img[^>]*src=["\']https://px\.ads\.linkedin\.com/collect\?pid=(\d+)', re.IGNORECASE | re.DOTALL)
-        self.linkedin_function = re.compile(r'_linkedin_data_partner_id\s*=\s*["\'](\d+)["\']', re.IGNORECASE)
-        self.linkedin_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?snap\.licdn\.com', re.IGNORECASE | re.DOTALL)
+        self.linkedin_partner_id = compile_pattern(r'linkedin\.com\/collect\?pid=(\d+)', re.IGNORECASE)
+        self.linkedin_script_url = compile_pattern(r'https://snap.licdn.com/li.lms-analytics/insight\.min\.js', re.IGNORECASE)
+        self.linkedin_noscript = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://px\.ads\.linkedin\.com/collect\?pid=(\d+)', re.IGNORECASE | re.DOTALL)
+        self.linkedin_function = compile_pattern(r'_linkedin_data_partner_id\s*=\s*["\'](\d+)["\']', re.IGNORECASE)
+        self.linkedin_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?snap\.licdn\.com', re.IGNORECASE | re.DOTALL)
 
         # Snap Pixel Patterns
-        self.snap_pixel_id = re.compile(r'snaptr\s*\(\s*["\']init["\']\s*,\s*["\']([^"\']+)["\']', re.IGNORECASE)
-        self.snap_script_url = re.compile(r'https://sc-static\.net/scevent.min\.js', re.IGNORECASE)
-        self.snap_noscript = re.compile(r'<noscript>.*?<img[^>]*src=["\']https://sc-static\.net/scevent\.gif\?id=([^"\']+)["\']', re.IGNORECASE | re.DOTALL)
-        self.snap_function = re.compile(r'snaptr\s*\(\s*["\']track["\']\s*,', re.IGNORECASE)
-        self.snap_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?sc-static\.net', re.IGNORECASE | re.DOTALL)
+        self.snap_pixel_id = compile_pattern(r'snaptr\s*\(\s*["\']init["\']\s*,\s*["\']([^"\']+)["\']', re.IGNORECASE)
+        self.snap_script_url = compile_pattern(r'https://sc-static\.net/scevent.min\.js', re.IGNORECASE)
+        self.snap_noscript = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://sc-static\.net/scevent\.gif\?id=([^"\']+)["\']', re.IGNORECASE | re.DOTALL)
+        self.snap_function = compile_pattern(r'snaptr\s*\(\s*["\']track["\']\s*,', re.IGNORECASE)
+        self.snap_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?sc-static\.net', re.IGNORECASE | re.DOTALL)
 
         # Universal Analytics Patterns
-        self.ua_tracking_id = re.compile(r'UA-\d{4,10}-\d{1,4}', re.IGNORECASE)
-        self.ua_script_url = re.compile(r'https://www\.google-analytics\.com/analytics\.js', re.IGNORECASE)
-        self.ua_function = re.compile(r'ga\s*\(\s*["\']create["\']|ga\s*\(\s*["\']send["\']', re.IGNORECASE)
-        self.ua_dynamic = re.compile(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?google-analytics\.com', re.IGNORECASE | re.DOTALL)
-
-        # hardcoded gtag patterns
-        self.hardcoded_gtag = re.compile(r'G-[A-Z0-9]{10}|UA-\d{4,10}-\d{1,4}', re.IGNORECASE)
+        self.ua_tracking_id = compile_pattern(r'UA-\d{4,10}-\d{1,4}', re.IGNORECASE)
+        self.ua_script_url = compile_pattern(r'https://www\.google-analytics\.com/analytics\.js', re.IGNORECASE)
+        self.ua_function = compile_pattern(r'ga\s*\(\s*["\']create["\']|ga\s*\(\s*["\']send["\']', re.IGNORECASE)
+        self.ua_dynamic = compile_pattern(r'createElement\s*\(\s*["\']script["\'][\s\S]{0,200}?google-analytics\.com', re.IGNORECASE | re.DOTALL)
 
         # advanced patterns
-        self.consent_managers = re.compile(r'cookiebot|onetrust|usercentrics|trustarc|iubenda', re.IGNORECASE)
-        self.lazy_loading = re.compile(r'intersectionobserver|requestidlecallback|loading\s*=\s*["\']lazy["\']', re.IGNORECASE)
-        self.spa_frameworks = re.compile(r'react|angular|vue|next\.js|nuxt|gatsby|svelte', re.IGNORECASE)
-        self.progressive_loading = re.compile(r'requestAnimationFrame|setTimeout|setInterval|Promise\.resolve\(\)\.then', re.IGNORECASE)
+        self.consent_managers = compile_pattern(r'cookiebot|onetrust|usercentrics|trustarc|iubenda', re.IGNORECASE)
+        self.lazy_loading = compile_pattern(r'intersectionobserver|requestidlecallback|loading\s*=\s*["\']lazy["\']', re.IGNORECASE)
+        self.late_loading = compile_pattern(r'(?P<consent>%s)|(?P<lazy>%s)' % (pattern_source(self.consent_managers), pattern_source(self.lazy_loading)), re.IGNORECASE)
+        self.spa_frameworks = compile_pattern(r'react|angular|vue|next\.js|nuxt|gatsby|svelte', re.IGNORECASE)
+        self.progressive_loading = compile_pattern(r'requestAnimationFrame|setTimeout|setInterval|Promise\.resolve\(\)\.then', re.IGNORECASE)
+
+        # Lowercase variants of the HTML patterns, matched without IGNORECASE against the pre-lowered page
+        self.gtm_container_id_lc = compile_pattern(r'gtm-[a-z0-9]{4,}')
+        self.gtm_datalayer_lc = compile_pattern(r'datalayer\s*=\s*\[|datalayer\.push\s*\(')
+        self.gtm_noscript_lc = compile_pattern(r'<noscript>.*?<iframe[^>]*src=["\']https://www\.googletagmanager\.com/ns\.html\?id=([^"\'&]+)', re.DOTALL)
+        self.tealium_async_lc = compile_pattern(r'\(function\s*\([a-z,\s]*\)\s*\{[^}]*tags\.tiqcdn\.com[^}]*\}\s*\)\s*\(\s*\)', re.DOTALL)
+        self.gtag_measurement_id_lc = compile_pattern(r'g-[a-z0-9]{10}')
+        self.meta_pixel_id_lc = compile_pattern(r'fbq\s*\(\s*["\']init["\']\s*,\s*["\'](\d{15,16})["\']')
+        self.meta_pixel_noscript_lc = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://www\.facebook\.com/tr\?id=(\d{15,16})', re.DOTALL)
+        self.tiktok_pixel_id_lc = compile_pattern(r'ttq\.load\s*\(\s*["\']([^"\']+)["\']')
+        self.tiktok_noscript_lc = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://analytics\.tiktok\.com/i18n/pixel/pixel\.gif\?id=([^"\']+)', re.DOTALL)
+        self.linkedin_partner_id_lc = compile_pattern(r'linkedin\.com\/collect\?pid=(\d+)')
+        self.linkedin_function_lc = compile_pattern(r'_linkedin_data_partner_id\s*=\s*["\'](\d+)["\']')
+        self.linkedin_noscript_lc = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://px\.ads\.linkedin\.com/collect\?pid=(\d+)', re.DOTALL)
+        self.snap_pixel_id_lc = compile_pattern(r'snaptr\s*\(\s*["\']init["\']\s*,\s*["\']([^"\']+)["\']')
+        self.snap_noscript_lc = compile_pattern(r'<noscript>.*?<img[^>]*src=["\']https://sc-static\.net/scevent\.gif\?id=([^"\']+)["\']', re.DOTALL)
+        self.ua_tracking_id_lc = compile_pattern(r'ua-\d{4,10}-\d{1,4}')
+
+        # Start of every dynamic-injection pattern, used to anchor them
+        self.create_element = compile_pattern(r'createElement', re.IGNORECASE)
+
+        # Hosts a script src points at, used to bucket scripts per page
+        self.script_host = compile_pattern(r'https://([^/"\'\s]+)', re.IGNORECASE)
 
         # Add tag domains pattern
         self.tag_domains = {
@@ -101,30 +362,265 @@ class CompiledPatterns:
             'sc-static.net',
             'tags.tiqcdn.com'
         }
-        
-        # Add performance tracking patterns
-        self.tag_load_patterns = {
-            'gtm': re.compile(r'dataLayer\.push\(\{[^}]*"gtm\.load"'),
-            'ga4': re.compile(r'gtag\("config"'),
-            'meta': re.compile(r'fbq\("init"'),
-            'tiktok': re.compile(r'ttq\.load\('),
-            'snap': re.compile(r'snaptr\("init"')
-        }
+
+class HyperscanPatternDB:
+    """Single-pass multi-pattern scan of a page text for every pattern of a group the plugins run over it"""
+    
+    # Patterns applied to the full HTML by the plugins' detect_static
+    HTML_PATTERNS = (
+        'gtm_container_id', 'gtm_datalayer', 'gtm_noscript',
+        'tealium_async',
+        'gtag_measurement_id',
+        'meta_pixel_id', 'meta_pixel_noscript',
+        'tiktok_pixel_id', 'tiktok_noscript',
+        'linkedin_partner_id', 'linkedin_function', 'linkedin_noscript',
+        'snap_pixel_id', 'snap_noscript',
+        'ua_tracking_id'
+    )
+    
+    # createElement(...) injection patterns; their [\s\S]{0,N}? gaps make start-of-match
+    # tracking too large for Hyperscan, so only their presence is reported
+    DYNAMIC_PATTERNS = (
+        'gtm_dynamic', 'tealium_dynamic', 'meta_pixel_dynamic', 'tiktok_dynamic',
+        'linkedin_dynamic', 'snap_dynamic', 'ua_dynamic'
+    )
+    
+    # Patterns applied to the joined inline scripts by the plugins' detect_static
+    SCRIPT_PATTERNS = (
+        'gtm_init_code',
+        'tealium_utag_data', 'tealium_functions',
+        'gtag_function',
+        'meta_pixel_function',
+        'tiktok_function',
+        'snap_function',
+        'ua_function'
+    ) + DYNAMIC_PATTERNS
+    
+    def __init__(self, patterns: CompiledPatterns, names: Tuple[str, ...] = HTML_PATTERNS):
+        self.ids = {name: pattern_id for pattern_id, name in enumerate(names)}
+        compiled = [getattr(patterns, name) for name in names]
+        self.database = None
+        self.pattern_set = None
+        self.scratch = threading.local()
+        
+        if HYPERSCAN_AVAILABLE:
+            expressions = [hyperscan_expression(pattern_source(pattern)) for pattern in compiled]
+            # A pattern Hyperscan cannot match like re is left out, and always searched by re
+            self.ids = {name: pattern_id for name, pattern_id in self.ids.items()
+                        if expressions[pattern_id] is not None}
+            self.database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            self.database.compile(
+                expressions=[expressions[pattern_id] for pattern_id in self.ids.values()],
+                ids=list(self.ids.values()),
+                elements=len(self.ids),
+                flags=[
+                    hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_UTF8 |
+                    (0 if name in self.DYNAMIC_PATTERNS else hyperscan.HS_FLAG_SOM_LEFTMOST)
+                    for name in self.ids
+                ]
+            )
+        elif RE2_AVAILABLE:
+            options = re2.Options()
+            options.case_sensitive = False
+            options.dot_nl = True
+            self.pattern_set = re2.Set.SearchSet(options)
+            # The Set takes the RE2 form of each pattern; one compile_pattern left to re is
+            # left out here too
+            self.ids = {name: self.pattern_set.Add(pattern.pattern) for name, pattern in zip(names, compiled)
+                        if not isinstance(pattern, re.Pattern)}
+            self.pattern_set.Compile()
+    
+    def scan(self, html_content: str, data: Optional[bytes] = None) -> Optional[Dict[int, List[Tuple[int, int]]]]:
+        """Map pattern id to the (start, end) byte offsets of its matches; None without a scanner.
+        
+        data is the raw body html_content was decoded from; Hyperscan scans it as-is when it
+        is ASCII, instead of re-encoding the text.
+        The RE2 fallback only reports which patterns matched, so its span lists are empty.
+        """
+        if self.database is not None:
+            matches: Dict[int, List[Tuple[int, int]]] = {}
+            
+            def on_match(pattern_id, start, end, flags, context):
+                matches.setdefault(pattern_id, []).append((start, end))
+            
+            # The database is compiled for UTF-8, which a non-ASCII raw body need not be
+            if data is None or len(data) != len(html_content) or not data.isascii():
+                data = html_content.encode('utf-8', errors='replace')
+            self.database.scan(data, match_event_handler=on_match,
+                               scratch=thread_scratch(self.database, self.scratch))
+            return matches
+        
+        if self.pattern_set is not None:
+            return {pattern_id: [] for pattern_id in self.pattern_set.Match(html_content) or ()}
+        
+        return None
+    
+    def start_offset(self, matches: Optional[Dict[int, List[Tuple[int, int]]]], name: str, text: str) -> Optional[int]:
+        """Where a plugin's regex can start scanning text; None when the scan proved there is no match"""
+        if matches is None or name not in self.ids:
+            return 0
+        
+        spans = matches.get(self.ids[name])
+        if spans is None:
+            return None
+        
+        # Byte offsets equal character offsets only for ASCII text
+        if spans and text.isascii():
+            return min(start for start, _ in spans)
+        return 0
+
+# Patterns are immutable, so compile them once and share them
+PATTERNS = CompiledPatterns()
+HTML_PATTERN_DB = HyperscanPatternDB(PATTERNS)
+SCRIPT_PATTERN_DB = HyperscanPatternDB(PATTERNS, HyperscanPatternDB.SCRIPT_PATTERNS)
+
+@dataclass(slots=True)
+class PageScan:
+    """A page as the plugins' detect_static see it, with the scans they share done once.
+    
+    html_lower is the lowercased html, all_scripts the joined inline script bodies and
+    scripts_by_host the external scripts bucketed by host. matches is HTML_PATTERN_DB.scan
+    of html and script_matches SCRIPT_PATTERN_DB.scan of all_scripts. signature_plugins
+    holds the plugins the shared signature scan saw one of their signatures for, None when
+    there was no such scan. tagchecker.scan_page builds one per page.
+    """
+    html: str
+    scripts: List[Dict]
+    patterns: CompiledPatterns
+    html_lower: str
+    all_scripts: str
+    scripts_by_host: Dict[str, List[Dict]]
+    matches: Optional[Dict[int, List[Tuple[int, int]]]]
+    script_matches: Optional[Dict[int, List[Tuple[int, int]]]]
+    progressive_loading: bool
+    spa: bool
+    signature_plugins: Optional[Set['TagDetectorPlugin']] = None
+    
+    def has_signature(self, plugin: 'TagDetectorPlugin') -> bool:
+        """Cheap substring gate run before any of the plugin's regexes"""
+        if not plugin.signatures:
+            return True
+        if self.signature_plugins is not None:
+            return plugin in self.signature_plugins
+        return any(signature in self.html_lower for signature in plugin.signatures)
+    
+    def host_scripts(self, host: str) -> List[Dict]:
+        """Scripts that may load from host, all of them when there is no host to bucket by"""
+        if not host:
+            return self.scripts
+        return self.scripts_by_host.get(host, ())
+    
+    def _html_pattern(self, name: str):
+        """Pick the case-sensitive lowercase variant when the page is ASCII.
+        
+        ASCII lowering keeps offsets aligned, so match spans index into html too.
+        """
+        if self.html.isascii():
+            return getattr(self.patterns, f'{name}_lc'), self.html_lower
+        return getattr(self.patterns, name), self.html
+    
+    def finditer(self, name: str):
+        """finditer for an HTML pattern, skipped or started late using the shared scan"""
+        start = HTML_PATTERN_DB.start_offset(self.matches, name, self.html)
+        if start is None:
+            return iter(())
+        pattern, haystack = self._html_pattern(name)
+        return pattern.finditer(haystack, start)
+    
+    def search(self, name: str):
+        """search for an HTML pattern, skipped or started late using the shared scan"""
+        start = HTML_PATTERN_DB.start_offset(self.matches, name, self.html)
+        if start is None:
+            return None
+        pattern, haystack = self._html_pattern(name)
+        return pattern.search(haystack, start)
+    
+    def noscript_blocks(self) -> List[Tuple[int, int]]:
+        """(start, end) offsets of each <noscript> block, located with str.find on the lowered page"""
+        if len(self.html_lower) != len(self.html):
+            # Lowering shifted offsets, fall back to the whole page
+            return [(0, len(self.html))]
+        
+        blocks = []
+        start = self.html_lower.find('<noscript')
+        while start != -1:
+            end = self.html_lower.find('</noscript>', start)
+            if end == -1:
+                blocks.append((start, len(self.html)))
+                break
+            blocks.append((start, end))
+            start = self.html_lower.find('<noscript', end)
+        return blocks
+    
+    def search_noscript(self, name: str):
+        """search for a noscript fallback pattern inside the <noscript> blocks only"""
+        start = HTML_PATTERN_DB.start_offset(self.matches, name, self.html)
+        if start is None:
+            return None
+        pattern, haystack = self._html_pattern(name)
+        for block_start, block_end in self.noscript_blocks():
+            if block_end <= start:
+                continue
+            match = pattern.search(haystack, max(block_start, start), block_end)
+            if match:
+                return match
+        return None
+    
+    def search_script(self, name: str):
+        """search for a script pattern, skipped or started late using the shared script scan"""
+        start = SCRIPT_PATTERN_DB.start_offset(self.script_matches, name, self.all_scripts)
+        if start is None:
+            return None
+        return getattr(self.patterns, name).search(self.all_scripts, start)
+    
+    def findall_script(self, name: str) -> List:
+        """findall for a script pattern, skipped or started late using the shared script scan"""
+        start = SCRIPT_PATTERN_DB.start_offset(self.script_matches, name, self.all_scripts)
+        if start is None:
+            return []
+        return getattr(self.patterns, name).findall(self.all_scripts, start)
+    
+    def search_dynamic(self, name: str) -> bool:
+        """Try a createElement(...) injection pattern only where createElement occurs"""
+        start = SCRIPT_PATTERN_DB.start_offset(self.script_matches, name, self.all_scripts)
+        if start is None:
+            return False
+        pattern = getattr(self.patterns, name)
+        for hit in self.patterns.create_element.finditer(self.all_scripts, start):
+            if pattern.match(self.all_scripts, hit.start()):
+                return True
+        return False
+
+# Static assets blocked during JavaScript execution. Chromium blocks them itself through
+# Network.setBlockedURLs, so no request interception is needed and the HTTP cache stays on.
+BLOCKED_EXTENSIONS = ('png', 'jpg', 'jpeg', 'gif', 'svg', 'webp', 'avif', 'ico', 'css',
+                      'woff', 'woff2', 'ttf', 'otf', 'eot', 'mp4', 'webm')
+BLOCKED_URL_PATTERNS = [pattern for extension in BLOCKED_EXTENSIONS
+                        for pattern in (f'*.{extension}', f'*.{extension}?*')]
 
 class RetryConfig:
     """Configuration for retry logic with exponential backoff"""
     
+    __slots__ = ('max_retries', 'base_delay', 'max_delay', 'backoff_factor', '_rng', 'delays')
+    
     def __init__(self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 30.0, backoff_factor: float = 2.0):
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.backoff_factor = backoff_factor
+        # Per-config generator, so jitter neither shares nor contends on the global random state
+        self._rng = random.Random()
+        # Backoff delays indexed by retry count
+        self.delays = [min(base_delay * (backoff_factor ** i), max_delay) for i in range(max_retries + 1)]
     
     def get_delay(self, retry_count: int) -> float:
         """Calculate delay with exponential backoff and jitter"""
-        delay = min(self.base_delay * (self.backoff_factor ** retry_count), self.max_delay)
-        # Add jitter to prevent thundering herd
-        jitter = delay * 0.1 * random.random()
+        if retry_count < len(self.delays):
+            delay = self.delays[retry_count]
+        else:
+            delay = min(self.base_delay * (self.backoff_factor ** retry_count), self.max_delay)
+        # Add up to 30% jitter so that retries against a rate-limited host spread out
+        jitter = delay * 0.3 * self._rng.random()
         return delay + jitter
 
 async def retry_async(func, *args, retry_config: RetryConfig = None, **kwargs):
@@ -167,30 +663,34 @@ def retry_sync(func, *args, retry_config: RetryConfig = None, **kwargs):
     
     raise last_exception
 
-@dataclass
+@dataclass(slots=True)
 class TagDetectionResult:
     found: bool = False
     confidence_score: int = 0
-    identifiers: List[str] = None
-    detection_methods: List[str] = None
-    verification_checks: List[str] = None
-    implementation_details: List[str] = None
-    warnings: List[str] = None
+    identifiers: List[str] = field(default_factory=list)
+    detection_methods: List[str] = field(default_factory=list)
+    verification_checks: List[str] = field(default_factory=list)
+    implementation_details: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
     loading_method: str = 'unknown'
     progressive_loading_detected: bool = False
     spa_detected: bool = False
-    
-    def __post_init__(self):
-        if self.identifiers is None:
-            self.identifiers = []
-        if self.detection_methods is None:
-            self.detection_methods = []
-        if self.verification_checks is None:
-            self.verification_checks = []
-        if self.implementation_details is None:
-            self.implementation_details = []
-        if self.warnings is None:
-            self.warnings = []
+
+# Field names of TagDetectionResult, in declaration order, for building result dicts
+RESULT_FIELDS = tuple(result_field.name for result_field in fields(TagDetectionResult))
+
+# Number of pages whose static results are kept in the per-checker body-hash cache
+STATIC_CACHE_SIZE = 1024
+
+def _merge_unique(a: List[str], b: List[str]) -> List[str]:
+    """Order-preserving union of two result lists without building a concatenated copy"""
+    return list(dict.fromkeys(chain(a, b)))
+
+# Prefix of a GTM container id, checked before upper-casing the whole id
+GTM_PREFIX = 'GTM-'
+
+# Detection methods that earn a calibration bonus
+HIGH_QUALITY_METHODS = frozenset({'Container ID Detection', 'Script URL Detection', 'Network Request Detection'})
 
 class ConfidenceCalibrator:
     """Calibrates confidence scores against known test cases"""
@@ -332,17 +832,31 @@ class ConfidenceCalibrator:
             calibrated += 10
         
         # Adjust based on method quality
-        high_quality_methods = ['Container ID Detection', 'Script URL Detection', 'Network Request Detection']
-        quality_methods = sum(1 for method in detection_methods if method in high_quality_methods)
+        quality_methods = len(HIGH_QUALITY_METHODS.intersection(detection_methods))
         calibrated += quality_methods * 5
         
         # Cap at 100
         return min(calibrated, 100)
+
+CALIBRATOR = ConfidenceCalibrator()
+
 class TagDetectorPlugin(ABC):
     """Abstract base class for tag detection plugins"""
     
+    __slots__ = ('calibrator',)
+    
+    # Lowercase substrings that must appear in the page for detect_static to find anything;
+    # an empty tuple disables the prefilter
+    signatures: Tuple[str, ...] = ()
+    # Host the plugin's script URL pattern points at
+    script_host: str = ''
+    # Substrings identifying the plugin's network requests
+    request_domains: Tuple[str, ...] = ()
+    # Lowercase keywords identifying the plugin's console messages
+    console_keywords: Tuple[str, ...] = ()
+    
     def __init__(self):
-        self.calibrator = ConfidenceCalibrator()
+        self.calibrator = CALIBRATOR
     
     @property
     @abstractmethod
@@ -355,16 +869,64 @@ class TagDetectorPlugin(ABC):
         pass
     
     @abstractmethod
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
-        """Detect tags from static HTML content"""
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
+        """Detect tags from a page's static HTML and scripts"""
         pass
     
     @abstractmethod 
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
-        """Detect tags from JavaScript execution results"""
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
+        """Detect tags from JavaScript execution results (plugin_requests are the
+        network_requests whose URL contains one of request_domains, console_message_count
+        is how many console_logs mention one of console_keywords, dom_matches is
+        HTML_PATTERN_DB.scan of dom_content)"""
         pass
     
+    def _set_page_flags(self, result: TagDetectionResult, page: PageScan):
+        """Page-level progressive loading and SPA flags"""
+        result.progressive_loading_detected = page.progressive_loading
+        result.spa_detected = page.spa
+    
+    def _add_page_warnings(self, result: TagDetectionResult):
+        """Warnings derived from the page-level progressive loading and SPA flags"""
+        if result.progressive_loading_detected:
+            result.warnings.append('Progressive loading detected - tags may load after user interaction')
+        
+        if result.spa_detected:
+            result.warnings.append('SPA framework detected - consider extended monitoring period')
+    
+    def _tag_requests(self, network_requests: List[Dict], plugin_requests: Optional[List[Dict]]) -> List[Dict]:
+        """Network requests for the plugin's domains, filtered here only when the caller did not"""
+        if plugin_requests is None:
+            plugin_requests = self.filter_requests([(req.get('url', ''), req) for req in network_requests])
+        return plugin_requests
+    
+    def filter_requests(self, request_urls: List[Tuple[str, Dict]]) -> List[Dict]:
+        """Requests whose URL contains one of the plugin's domains, from (url, request) pairs"""
+        if not self.request_domains:
+            return []
+        domain_pattern = compile_pattern('|'.join(map(re.escape, self.request_domains)))
+        return [req for url, req in request_urls if domain_pattern.search(url)]
+    
+    def _console_message_count(self, console_logs: List[str], console_message_count: Optional[int]) -> int:
+        """Console messages mentioning the plugin, counted here only when the caller did not"""
+        if console_message_count is None:
+            if not self.console_keywords:
+                return 0
+            console_pattern = compile_pattern('|'.join(map(re.escape, self.console_keywords)), re.IGNORECASE)
+            console_message_count = sum(1 for log in console_logs if console_pattern.search(log))
+        return console_message_count
+    
+    def _search_dom(self, patterns: CompiledPatterns, name: str, dom_content: str, dom_matches):
+        """search for an HTML pattern in the final DOM, skipped or started late using its shared scan"""
+        start = HTML_PATTERN_DB.start_offset(dom_matches, name, dom_content)
+        if start is None:
+            return None
+        return getattr(patterns, name).search(dom_content, start)
+    
     def detect_progressive_loading(self, html_content: str, patterns: CompiledPatterns) -> bool:
         """Detect progressive loading patterns in SPAs"""
         return bool(patterns.progressive_loading.search(html_content) or
@@ -372,35 +934,41 @@ class TagDetectorPlugin(ABC):
     
     def merge_results(self, static_result: TagDetectionResult, 
                      dynamic_result: TagDetectionResult) -> TagDetectionResult:
-        """Merge static and dynamic detection results"""
-        merged = TagDetectionResult()
-        merged.found = static_result.found or dynamic_result.found
-        
+        """Merge static and dynamic detection results, building each merged list once"""
         # Use calibrated confidence score
         raw_confidence = max(static_result.confidence_score, dynamic_result.confidence_score)
-        all_methods = list(set(static_result.detection_methods + dynamic_result.detection_methods))
-        merged.confidence_score = self.calibrator.calibrate_score(raw_confidence, self.name.lower(), all_methods)
-        
-        merged.identifiers = list(set(static_result.identifiers + dynamic_result.identifiers))
-        merged.detection_methods = all_methods
-        merged.verification_checks = list(set(static_result.verification_checks + dynamic_result.verification_checks))
-        merged.implementation_details = list(set(static_result.implementation_details + dynamic_result.implementation_details))
-        merged.warnings = list(set(static_result.warnings + dynamic_result.warnings))
-        
-        merged.progressive_loading_detected = static_result.progressive_loading_detected or dynamic_result.progressive_loading_detected
-        merged.spa_detected = static_result.spa_detected or dynamic_result.spa_detected
+        all_methods = _merge_unique(static_result.detection_methods, dynamic_result.detection_methods)
         
         # Prefer dynamic loading method if available
         if dynamic_result.loading_method != 'unknown':
-            merged.loading_method = dynamic_result.loading_method
+            loading_method = dynamic_result.loading_method
         else:
-            merged.loading_method = static_result.loading_method
-            
-        return merged
+            loading_method = static_result.loading_method
+        
+        return TagDetectionResult(
+            found=static_result.found or dynamic_result.found,
+            confidence_score=self.calibrator.calibrate_score(raw_confidence, self.name.lower(), all_methods),
+            identifiers=_merge_unique(static_result.identifiers, dynamic_result.identifiers),
+            detection_methods=all_methods,
+            verification_checks=_merge_unique(static_result.verification_checks, dynamic_result.verification_checks),
+            implementation_details=_merge_unique(static_result.implementation_details, dynamic_result.implementation_details),
+            warnings=_merge_unique(static_result.warnings, dynamic_result.warnings),
+            loading_method=loading_method,
+            progressive_loading_detected=static_result.progressive_loading_detected or dynamic_result.progressive_loading_detected,
+            spa_detected=static_result.spa_detected or dynamic_result.spa_detected,
+        )
     
 class GTMDetectorPlugin(TagDetectorPlugin):
     """Google Tag Manager detection plugin"""
     
+    __slots__ = ()
+    
+    # Lowercase substrings at least one of which every static detection path needs
+    signatures = ('gtm-', 'gtm.start', 'datalayer', 'googletagmanager')
+    script_host = 'www.googletagmanager.com'
+    request_domains = ('googletagmanager.com',)
+    console_keywords = ('gtm', 'google tag manager', 'datalayer')
+    
     @property
     def name(self) -> str:
         return "Google Tag Manager"
@@ -409,20 +977,24 @@ class GTMDetectorPlugin(TagDetectorPlugin):
     def version(self) -> str:
         return "3.0.0"
     
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
         result = TagDetectionResult()
-        html_lower = html_content.lower()
         
         # Progressive loading detection
-        result.progressive_loading_detected = self.detect_progressive_loading(html_content, patterns)
-        result.spa_detected = bool(patterns.spa_frameworks.search(html_content))
+        self._set_page_flags(result, page)
+        
+        # Skip the regexes entirely when none of the plugin's signatures occur
+        if not page.has_signature(self):
+            self._add_page_warnings(result)
+            return result
         
         # Container ID detection
-        container_ids = set()
-        for match in patterns.gtm_container_id.finditer(html_content):
+        container_ids = []
+        for match in page.finditer('gtm_container_id'):
             container_id = match.group(0).upper()
             if len(container_id) >= 8:
-                container_ids.add(container_id)
+                if container_id not in container_ids:
+                    container_ids.append(container_id)
                 result.confidence_score += 40
         
         if container_ids:
@@ -430,64 +1002,65 @@ class GTMDetectorPlugin(TagDetectorPlugin):
             result.detection_methods.append('Container ID Detection')
         
         # Script URL detection
-        for script in scripts:
+        for script in page.host_scripts(self.script_host):
             if script.get('src'):
-                match = patterns.gtm_script_url.search(script['src'])
+                match = page.patterns.gtm_script_url.search(script['src'])
                 if match:
-                    gtm_id = match.group(1).upper()
-                    if gtm_id.startswith('GTM-'):
-                        container_ids.add(gtm_id)
+                    gtm_id = match.group(1)
+                    if gtm_id[:len(GTM_PREFIX)].upper() == GTM_PREFIX:
+                        container_id = gtm_id.upper()
+                        if container_id not in container_ids:
+                            container_ids.append(container_id)
                         result.confidence_score += 35
                         result.verification_checks.append('GTM Script URL Verified')
                         result.loading_method = 'direct_script'
         
         # Initialization code
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if patterns.gtm_init_code.search(all_scripts):
+        if page.search_script('gtm_init_code'):
             result.confidence_score += 20
             result.detection_methods.append('Initialization Code')
         
         # DataLayer detection
-        if patterns.gtm_datalayer.search(html_lower):
+        if page.search('gtm_datalayer'):
             result.confidence_score += 15
             result.detection_methods.append('DataLayer Detection')
         
         # Dynamic script creation
-        if patterns.gtm_dynamic.search(all_scripts):
+        if page.search_dynamic('gtm_dynamic'):
             result.confidence_score += 30
             result.detection_methods.append('Dynamic Script Creation')
             result.loading_method = 'dynamic_insertion'
         
         # Noscript iframe
-        noscript_match = patterns.gtm_noscript.search(html_content)
+        noscript_match = page.search_noscript('gtm_noscript')
         if noscript_match:
-            gtm_id = noscript_match.group(1).upper()
-            if gtm_id.startswith('GTM-'):
-                container_ids.add(gtm_id)
+            gtm_id = noscript_match.group(1)
+            if gtm_id[:len(GTM_PREFIX)].upper() == GTM_PREFIX:
+                container_id = gtm_id.upper()
+                if container_id not in container_ids:
+                    container_ids.append(container_id)
             result.confidence_score += 10
             result.detection_methods.append('Noscript Iframe')
         
         # Progressive loading warnings
-        if result.progressive_loading_detected:
-            result.warnings.append('Progressive loading detected - tags may load after user interaction')
-        
-        if result.spa_detected:
-            result.warnings.append('SPA framework detected - consider extended monitoring period')
+        self._add_page_warnings(result)
         
         # Final determination
         if result.confidence_score >= 35:
             result.found = True
-            result.identifiers = list(container_ids)
+            result.identifiers = container_ids
         
         return result
     
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Check network requests for GTM
-        gtm_requests = [req for req in network_requests 
-                       if 'googletagmanager.com' in req.get('url', '')]
+        gtm_requests = self._tag_requests(network_requests, plugin_requests)
         
         if gtm_requests:
             result.confidence_score += 50
@@ -496,24 +1069,18 @@ class GTMDetectorPlugin(TagDetectorPlugin):
             result.loading_method = 'javascript_execution'
             
             # Extract container IDs from requests
-            container_ids = set()
-            for req in gtm_requests:
-                matches = patterns.gtm_container_id.findall(req['url'])
-                for match in matches:
-                    container_ids.add(match.upper())
-            
-            result.identifiers = list(container_ids)
+            result.identifiers = list(dict.fromkeys(
+                match.upper() for req in gtm_requests for match in patterns.gtm_container_id.findall(req['url'])))
         
         # Check console logs for GTM messages
-        gtm_console_messages = [log for log in console_logs 
-                               if any(keyword in log.lower() for keyword in ['gtm', 'google tag manager', 'datalayer'])]
+        gtm_console_count = self._console_message_count(console_logs, console_message_count)
         
-        if gtm_console_messages:
+        if gtm_console_count:
             result.confidence_score += 15
-            result.implementation_details.append(f'GTM console messages: {len(gtm_console_messages)}')
+            result.implementation_details.append(f'GTM console messages: {gtm_console_count}')
         
         # Check final DOM for GTM elements
-        if patterns.gtm_container_id.search(dom_content):
+        if self._search_dom(patterns, 'gtm_container_id', dom_content, dom_matches):
             result.confidence_score += 20
             result.verification_checks.append('GTM Found in Final DOM')
         
@@ -528,6 +1095,14 @@ class GTMDetectorPlugin(TagDetectorPlugin):
 class TealiumDetectorPlugin(TagDetectorPlugin):
     """Tealium detection plugin"""
     
+    __slots__ = ()
+    
+    # Lowercase substrings at least one of which every static detection path needs
+    signatures = ('tiqcdn', 'utag')
+    script_host = 'tags.tiqcdn.com'
+    request_domains = ('tiqcdn.com', 'tealium')
+    console_keywords = ('tealium', 'utag', 'tiq')
+    
     @property
     def name(self) -> str:
         return "Tealium"
@@ -536,48 +1111,52 @@ class TealiumDetectorPlugin(TagDetectorPlugin):
     def version(self) -> str:
         return "3.0.0"
     
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Progressive loading detection
-        result.progressive_loading_detected = self.detect_progressive_loading(html_content, patterns)
-        result.spa_detected = bool(patterns.spa_frameworks.search(html_content))
+        self._set_page_flags(result, page)
+        
+        # Skip the regexes entirely when none of the plugin's signatures occur
+        if not page.has_signature(self):
+            return result
         
         # Script URL detection
-        account_info = set()
-        for script in scripts:
+        account_info = []
+        for script in page.host_scripts(self.script_host):
             if script.get('src'):
-                match = patterns.tealium_url.search(script['src'])
+                match = page.patterns.tealium_url.search(script['src'])
                 if match:
                     account, profile, env = match.groups()
-                    account_info.add(f"{account}/{profile}/{env}")
+                    account_path = f"{account}/{profile}/{env}"
+                    if account_path not in account_info:
+                        account_info.append(account_path)
                     result.confidence_score += 40
                     result.loading_method = 'direct_script'
         
         if account_info:
-            result.identifiers = list(account_info)
+            result.identifiers = account_info
             result.detection_methods.append('Script URL Detection')
         
         # utag_data variable detection
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if patterns.tealium_utag_data.search(all_scripts):
+        if page.search_script('tealium_utag_data'):
             result.confidence_score += 25
             result.detection_methods.append('utag_data Variable')
         
         # Async loading pattern
-        if patterns.tealium_async.search(html_content):
+        if page.search('tealium_async'):
             result.confidence_score += 20
             result.detection_methods.append('Async Loading Pattern')
             result.loading_method = 'async_function'
         
         # Function calls
-        function_matches = patterns.tealium_functions.findall(all_scripts)
+        function_matches = page.findall_script('tealium_functions')
         if function_matches:
             result.confidence_score += len(function_matches) * 3
             result.detection_methods.append('Tealium Functions')
         
         # Dynamic script creation
-        if patterns.tealium_dynamic.search(all_scripts):
+        if page.search_dynamic('tealium_dynamic'):
             result.confidence_score += 30
             result.detection_methods.append('Dynamic Script Creation')
             result.loading_method = 'dynamic_insertion'
@@ -588,12 +1167,14 @@ class TealiumDetectorPlugin(TagDetectorPlugin):
         return result
     
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Check network requests for Tealium
-        tealium_requests = [req for req in network_requests 
-                           if 'tiqcdn.com' in req.get('url', '') or 'tealium' in req.get('url', '')]
+        tealium_requests = self._tag_requests(network_requests, plugin_requests)
         
         if tealium_requests:
             result.confidence_score += 50
@@ -602,21 +1183,16 @@ class TealiumDetectorPlugin(TagDetectorPlugin):
             result.loading_method = 'javascript_execution'
             
             # Extract account info from requests
-            account_info = set()
-            for req in tealium_requests:
-                matches = patterns.tealium_url.findall(req['url'])
-                for account, profile, env in matches:
-                    account_info.add(f"{account}/{profile}/{env}")
-            
-            result.identifiers = list(account_info)
+            result.identifiers = list(dict.fromkeys(
+                f"{account}/{profile}/{env}"
+                for req in tealium_requests for account, profile, env in patterns.tealium_url.findall(req['url'])))
         
         # Check console logs for Tealium messages
-        tealium_console_messages = [log for log in console_logs 
-                                   if any(keyword in log.lower() for keyword in ['tealium', 'utag', 'tiq'])]
+        tealium_console_count = self._console_message_count(console_logs, console_message_count)
         
-        if tealium_console_messages:
+        if tealium_console_count:
             result.confidence_score += 15
-            result.implementation_details.append(f'Tealium console messages: {len(tealium_console_messages)}')
+            result.implementation_details.append(f'Tealium console messages: {tealium_console_count}')
         
         if result.confidence_score >= 30:
             result.found = True
@@ -626,6 +1202,14 @@ class TealiumDetectorPlugin(TagDetectorPlugin):
 class GtagDetectorPlugin(TagDetectorPlugin):
     """Gtag detection plugin"""
     
+    __slots__ = ()
+    
+    # Lowercase substrings at least one of which every static detection path needs
+    signatures = ('g-', 'gtag')
+    script_host = 'www.googletagmanager.com'
+    request_domains = ('googletagmanager.com',)
+    console_keywords = ('gtag', 'google analytics')
+    
     @property
     def name(self) -> str:
         return "Gtag"
@@ -634,18 +1218,23 @@ class GtagDetectorPlugin(TagDetectorPlugin):
     def version(self) -> str:
         return "3.0.0"
     
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Progressive loading detection
-        result.progressive_loading_detected = self.detect_progressive_loading(html_content, patterns)
-        result.spa_detected = bool(patterns.spa_frameworks.search(html_content))
+        self._set_page_flags(result, page)
+        
+        # Skip the regexes entirely when none of the plugin's signatures occur
+        if not page.has_signature(self):
+            self._add_page_warnings(result)
+            return result
         
         # Measurement ID detection
-        measurement_ids = set()
-        for match in patterns.gtag_measurement_id.finditer(html_content):
+        measurement_ids = []
+        for match in page.finditer('gtag_measurement_id'):
             measurement_id = match.group(0).upper()
-            measurement_ids.add(measurement_id)
+            if measurement_id not in measurement_ids:
+                measurement_ids.append(measurement_id)
             result.confidence_score += 40
         
         if measurement_ids:
@@ -653,41 +1242,40 @@ class GtagDetectorPlugin(TagDetectorPlugin):
             result.detection_methods.append('Measurement ID Detection')
         
         # Script URL detection
-        for script in scripts:
+        for script in page.host_scripts(self.script_host):
             if script.get('src'):
-                match = patterns.gtag_script_url.search(script['src'])
+                match = page.patterns.gtag_script_url.search(script['src'])
                 if match:
                     gtag_id = match.group(1).upper()
-                    measurement_ids.add(gtag_id)
+                    if gtag_id not in measurement_ids:
+                        measurement_ids.append(gtag_id)
                     result.confidence_score += 35
                     result.verification_checks.append('Gtag Script URL Verified')
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if patterns.gtag_function.search(all_scripts):
+        if page.search_script('gtag_function'):
             result.confidence_score += 20
             result.detection_methods.append('Gtag Function Calls')
         
         # Progressive loading warnings
-        if result.progressive_loading_detected:
-            result.warnings.append('Progressive loading detected - tags may load after user interaction')
-        
-        if result.spa_detected:
-            result.warnings.append('SPA framework detected - consider extended monitoring period')
+        self._add_page_warnings(result)
         
         if result.confidence_score >= 30:
             result.found = True
-            result.identifiers = list(measurement_ids)
+            result.identifiers = measurement_ids
         
         return result
     
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Check network requests for Gtag
-        gtag_requests = [req for req in network_requests 
+        gtag_requests = [req for req in self._tag_requests(network_requests, plugin_requests)
                         if 'googletagmanager.com/gtag' in req.get('url', '')]
         
         if gtag_requests:
@@ -697,24 +1285,18 @@ class GtagDetectorPlugin(TagDetectorPlugin):
             result.loading_method = 'javascript_execution'
             
             # Extract measurement IDs from requests
-            measurement_ids = set()
-            for req in gtag_requests:
-                matches = patterns.gtag_measurement_id.findall(req['url'])
-                for match in matches:
-                    measurement_ids.add(match.upper())
-            
-            result.identifiers = list(measurement_ids)
+            result.identifiers = list(dict.fromkeys(
+                match.upper() for req in gtag_requests for match in patterns.gtag_measurement_id.findall(req['url'])))
         
         # Check console logs for Gtag messages
-        gtag_console_messages = [log for log in console_logs 
-                                if any(keyword in log.lower() for keyword in ['gtag', 'google analytics'])]
+        gtag_console_count = self._console_message_count(console_logs, console_message_count)
         
-        if gtag_console_messages:
+        if gtag_console_count:
             result.confidence_score += 15
-            result.implementation_details.append(f'Gtag console messages: {len(gtag_console_messages)}')
+            result.implementation_details.append(f'Gtag console messages: {gtag_console_count}')
         
         # Check final DOM for Gtag elements
-        if patterns.gtag_measurement_id.search(dom_content):
+        if self._search_dom(patterns, 'gtag_measurement_id', dom_content, dom_matches):
             result.confidence_score += 20
             result.verification_checks.append('Gtag Found in Final DOM')
         
@@ -726,6 +1308,14 @@ class GtagDetectorPlugin(TagDetectorPlugin):
 class MetaPixelDetectorPlugin(TagDetectorPlugin):
     """Meta Pixel detection plugin"""
     
+    __slots__ = ()
+    
+    # Lowercase substrings at least one of which every static detection path needs
+    signatures = ('fbq', 'facebook')
+    script_host = 'connect.facebook.net'
+    request_domains = ('facebook.com', 'connect.facebook.net')
+    console_keywords = ('facebook', 'meta', 'fbq')
+    
     @property
     def name(self) -> str:
         return "Meta Pixel"
@@ -734,18 +1324,23 @@ class MetaPixelDetectorPlugin(TagDetectorPlugin):
     def version(self) -> str:
         return "3.0.0"
     
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Progressive loading detection
-        result.progressive_loading_detected = self.detect_progressive_loading(html_content, patterns)
-        result.spa_detected = bool(patterns.spa_frameworks.search(html_content))
+        self._set_page_flags(result, page)
+        
+        # Skip the regexes entirely when none of the plugin's signatures occur
+        if not page.has_signature(self):
+            self._add_page_warnings(result)
+            return result
         
         # Pixel ID detection
-        pixel_ids = set()
-        for match in patterns.meta_pixel_id.finditer(html_content):
+        pixel_ids = []
+        for match in page.finditer('meta_pixel_id'):
             pixel_id = match.group(1)
-            pixel_ids.add(pixel_id)
+            if pixel_id not in pixel_ids:
+                pixel_ids.append(pixel_id)
             result.confidence_score += 40
         
         if pixel_ids:
@@ -753,53 +1348,51 @@ class MetaPixelDetectorPlugin(TagDetectorPlugin):
             result.detection_methods.append('Pixel ID Detection')
         
         # Script URL detection
-        for script in scripts:
+        for script in page.host_scripts(self.script_host):
             if script.get('src'):
-                if patterns.meta_pixel_script_url.search(script['src']):
+                if page.patterns.meta_pixel_script_url.search(script['src']):
                     result.confidence_score += 35
                     result.verification_checks.append('Meta Pixel Script URL Verified')
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if patterns.meta_pixel_function.search(all_scripts):
+        if page.search_script('meta_pixel_function'):
             result.confidence_score += 20
             result.detection_methods.append('Meta Pixel Function Calls')
         
         # Dynamic script creation
-        if patterns.meta_pixel_dynamic.search(all_scripts):
+        if page.search_dynamic('meta_pixel_dynamic'):
             result.confidence_score += 30
             result.detection_methods.append('Dynamic Script Creation')
             result.loading_method = 'dynamic_insertion'
         
         # Noscript detection
-        noscript_match = patterns.meta_pixel_noscript.search(html_content)
+        noscript_match = page.search_noscript('meta_pixel_noscript')
         if noscript_match:
             pixel_id = noscript_match.group(1)
-            pixel_ids.add(pixel_id)
+            if pixel_id not in pixel_ids:
+                pixel_ids.append(pixel_id)
             result.confidence_score += 10
             result.detection_methods.append('Noscript Detection')
         
         # Progressive loading warnings
-        if result.progressive_loading_detected:
-            result.warnings.append('Progressive loading detected - tags may load after user interaction')
-        
-        if result.spa_detected:
-            result.warnings.append('SPA framework detected - consider extended monitoring period')
+        self._add_page_warnings(result)
         
         if result.confidence_score >= 30:
             result.found = True
-            result.identifiers = list(pixel_ids)
+            result.identifiers = pixel_ids
         
         return result
     
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Check network requests for Meta Pixel
-        meta_requests = [req for req in network_requests 
-                        if any(domain in req.get('url', '') for domain in ['facebook.com', 'connect.facebook.net'])]
+        meta_requests = self._tag_requests(network_requests, plugin_requests)
         
         if meta_requests:
             result.confidence_score += 50
@@ -808,24 +1401,18 @@ class MetaPixelDetectorPlugin(TagDetectorPlugin):
             result.loading_method = 'javascript_execution'
             
             # Extract pixel IDs from requests
-            pixel_ids = set()
-            for req in meta_requests:
-                matches = patterns.meta_pixel_id.findall(req['url'])
-                for match in matches:
-                    pixel_ids.add(match)
-            
-            result.identifiers = list(pixel_ids)
+            result.identifiers = list(dict.fromkeys(
+                match for req in meta_requests for match in patterns.meta_pixel_id.findall(req['url'])))
         
         # Check console logs for Meta messages
-        meta_console_messages = [log for log in console_logs 
-                                if any(keyword in log.lower() for keyword in ['facebook', 'meta', 'fbq'])]
+        meta_console_count = self._console_message_count(console_logs, console_message_count)
         
-        if meta_console_messages:
+        if meta_console_count:
             result.confidence_score += 15
-            result.implementation_details.append(f'Meta Pixel console messages: {len(meta_console_messages)}')
+            result.implementation_details.append(f'Meta Pixel console messages: {meta_console_count}')
         
         # Check final DOM for Meta Pixel elements
-        if patterns.meta_pixel_id.search(dom_content):
+        if self._search_dom(patterns, 'meta_pixel_id', dom_content, dom_matches):
             result.confidence_score += 20
             result.verification_checks.append('Meta Pixel Found in Final DOM')
         
@@ -837,6 +1424,14 @@ class MetaPixelDetectorPlugin(TagDetectorPlugin):
 class TikTokPixelDetectorPlugin(TagDetectorPlugin):
     """TikTok Pixel detection plugin"""
     
+    __slots__ = ()
+    
+    # Lowercase substrings at least one of which every static detection path needs
+    signatures = ('ttq', 'tiktok')
+    script_host = 'analytics.tiktok.com'
+    request_domains = ('analytics.tiktok.com',)
+    console_keywords = ('tiktok', 'ttq')
+    
     @property
     def name(self) -> str:
         return "TikTok Pixel"
@@ -845,18 +1440,23 @@ class TikTokPixelDetectorPlugin(TagDetectorPlugin):
     def version(self) -> str:
         return "3.0.0"
     
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Progressive loading detection
-        result.progressive_loading_detected = self.detect_progressive_loading(html_content, patterns)
-        result.spa_detected = bool(patterns.spa_frameworks.search(html_content))
+        self._set_page_flags(result, page)
+        
+        # Skip the regexes entirely when none of the plugin's signatures occur
+        if not page.has_signature(self):
+            self._add_page_warnings(result)
+            return result
         
         # Pixel ID detection
-        pixel_ids = set()
-        for match in patterns.tiktok_pixel_id.finditer(html_content):
-            pixel_id = match.group(1)
-            pixel_ids.add(pixel_id)
+        pixel_ids = []
+        for match in page.finditer('tiktok_pixel_id'):
+            pixel_id = page.html[match.start(1):match.end(1)]
+            if pixel_id not in pixel_ids:
+                pixel_ids.append(pixel_id)
             result.confidence_score += 40
         
         if pixel_ids:
@@ -864,53 +1464,51 @@ class TikTokPixelDetectorPlugin(TagDetectorPlugin):
             result.detection_methods.append('Pixel ID Detection')
         
         # Script URL detection
-        for script in scripts:
+        for script in page.host_scripts(self.script_host):
             if script.get('src'):
-                if patterns.tiktok_script_url.search(script['src']):
+                if page.patterns.tiktok_script_url.search(script['src']):
                     result.confidence_score += 35
                     result.verification_checks.append('TikTok Pixel Script URL Verified')
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if patterns.tiktok_function.search(all_scripts):
+        if page.search_script('tiktok_function'):
             result.confidence_score += 20
             result.detection_methods.append('TikTok Function Calls')
         
         # Dynamic script creation
-        if patterns.tiktok_dynamic.search(all_scripts):
+        if page.search_dynamic('tiktok_dynamic'):
             result.confidence_score += 30
             result.detection_methods.append('Dynamic Script Creation')
             result.loading_method = 'dynamic_insertion'
         
         # Noscript detection
-        noscript_match = patterns.tiktok_noscript.search(html_content)
+        noscript_match = page.search_noscript('tiktok_noscript')
         if noscript_match:
-            pixel_id = noscript_match.group(1)
-            pixel_ids.add(pixel_id)
+            pixel_id = page.html[noscript_match.start(1):noscript_match.end(1)]
+            if pixel_id not in pixel_ids:
+                pixel_ids.append(pixel_id)
             result.confidence_score += 10
             result.detection_methods.append('Noscript Detection')
         
         # Progressive loading warnings
-        if result.progressive_loading_detected:
-            result.warnings.append('Progressive loading detected - tags may load after user interaction')
-        
-        if result.spa_detected:
-            result.warnings.append('SPA framework detected - consider extended monitoring period')
+        self._add_page_warnings(result)
         
         if result.confidence_score >= 30:
             result.found = True
-            result.identifiers = list(pixel_ids)
+            result.identifiers = pixel_ids
         
         return result
     
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Check network requests for TikTok Pixel
-        tiktok_requests = [req for req in network_requests 
-                          if 'analytics.tiktok.com' in req.get('url', '')]
+        tiktok_requests = self._tag_requests(network_requests, plugin_requests)
         
         if tiktok_requests:
             result.confidence_score += 50
@@ -919,24 +1517,18 @@ class TikTokPixelDetectorPlugin(TagDetectorPlugin):
             result.loading_method = 'javascript_execution'
             
             # Extract pixel IDs from requests
-            pixel_ids = set()
-            for req in tiktok_requests:
-                matches = patterns.tiktok_pixel_id.findall(req['url'])
-                for match in matches:
-                    pixel_ids.add(match)
-            
-            result.identifiers = list(pixel_ids)
+            result.identifiers = list(dict.fromkeys(
+                match for req in tiktok_requests for match in patterns.tiktok_pixel_id.findall(req['url'])))
         
         # Check console logs for TikTok messages
-        tiktok_console_messages = [log for log in console_logs 
-                                  if any(keyword in log.lower() for keyword in ['tiktok', 'ttq'])]
+        tiktok_console_count = self._console_message_count(console_logs, console_message_count)
         
-        if tiktok_console_messages:
+        if tiktok_console_count:
             result.confidence_score += 15
-            result.implementation_details.append(f'TikTok Pixel console messages: {len(tiktok_console_messages)}')
+            result.implementation_details.append(f'TikTok Pixel console messages: {tiktok_console_count}')
         
         # Check final DOM for TikTok Pixel elements
-        if patterns.tiktok_pixel_id.search(dom_content):
+        if self._search_dom(patterns, 'tiktok_pixel_id', dom_content, dom_matches):
             result.confidence_score += 20
             result.verification_checks.append('TikTok Pixel Found in Final DOM')
         
@@ -948,6 +1540,14 @@ class TikTokPixelDetectorPlugin(TagDetectorPlugin):
 class LinkedInInsightDetectorPlugin(TagDetectorPlugin):
     """LinkedIn Insight Tag detection plugin"""
     
+    __slots__ = ()
+    
+    # Lowercase substrings at least one of which every static detection path needs
+    signatures = ('linkedin', 'licdn')
+    script_host = 'snap.licdn.com'
+    request_domains = ('linkedin.com', 'snap.licdn.com')
+    console_keywords = ('linkedin', 'li_')
+    
     @property
     def name(self) -> str:
         return "LinkedIn Insight Tag"
@@ -956,24 +1556,30 @@ class LinkedInInsightDetectorPlugin(TagDetectorPlugin):
     def version(self) -> str:
         return "3.0.0"
     
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Progressive loading detection
-        result.progressive_loading_detected = self.detect_progressive_loading(html_content, patterns)
-        result.spa_detected = bool(patterns.spa_frameworks.search(html_content))
+        self._set_page_flags(result, page)
+        
+        # Skip the regexes entirely when none of the plugin's signatures occur
+        if not page.has_signature(self):
+            self._add_page_warnings(result)
+            return result
         
         # Partner ID detection
-        partner_ids = set()
-        for match in patterns.linkedin_partner_id.finditer(html_content):
+        partner_ids = []
+        for match in page.finditer('linkedin_partner_id'):
             partner_id = match.group(1)
-            partner_ids.add(partner_id)
+            if partner_id not in partner_ids:
+                partner_ids.append(partner_id)
             result.confidence_score += 40
         
         # Function-based partner ID detection
-        for match in patterns.linkedin_function.finditer(html_content):
+        for match in page.finditer('linkedin_function'):
             partner_id = match.group(1)
-            partner_ids.add(partner_id)
+            if partner_id not in partner_ids:
+                partner_ids.append(partner_id)
             result.confidence_score += 35
         
         if partner_ids:
@@ -981,48 +1587,46 @@ class LinkedInInsightDetectorPlugin(TagDetectorPlugin):
             result.detection_methods.append('Partner ID Detection')
         
         # Script URL detection
-        for script in scripts:
+        for script in page.host_scripts(self.script_host):
             if script.get('src'):
-                if patterns.linkedin_script_url.search(script['src']):
+                if page.patterns.linkedin_script_url.search(script['src']):
                     result.confidence_score += 35
                     result.verification_checks.append('LinkedIn Insight Script URL Verified')
                     result.loading_method = 'direct_script'
         
         # Dynamic script creation
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if patterns.linkedin_dynamic.search(all_scripts):
+        if page.search_dynamic('linkedin_dynamic'):
             result.confidence_score += 30
             result.detection_methods.append('Dynamic Script Creation')
             result.loading_method = 'dynamic_insertion'
         
         # Noscript detection
-        noscript_match = patterns.linkedin_noscript.search(html_content)
+        noscript_match = page.search_noscript('linkedin_noscript')
         if noscript_match:
             partner_id = noscript_match.group(1)
-            partner_ids.add(partner_id)
+            if partner_id not in partner_ids:
+                partner_ids.append(partner_id)
             result.confidence_score += 10
             result.detection_methods.append('Noscript Detection')
         
         # Progressive loading warnings
-        if result.progressive_loading_detected:
-            result.warnings.append('Progressive loading detected - tags may load after user interaction')
-        
-        if result.spa_detected:
-            result.warnings.append('SPA framework detected - consider extended monitoring period')
+        self._add_page_warnings(result)
         
         if result.confidence_score >= 30:
             result.found = True
-            result.identifiers = list(partner_ids)
+            result.identifiers = partner_ids
         
         return result
     
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Check network requests for LinkedIn Insight
-        linkedin_requests = [req for req in network_requests 
-                            if any(domain in req.get('url', '') for domain in ['linkedin.com', 'snap.licdn.com'])]
+        linkedin_requests = self._tag_requests(network_requests, plugin_requests)
         
         if linkedin_requests:
             result.confidence_score += 50
@@ -1031,24 +1635,19 @@ class LinkedInInsightDetectorPlugin(TagDetectorPlugin):
             result.loading_method = 'javascript_execution'
             
             # Extract partner IDs from requests
-            partner_ids = set()
-            for req in linkedin_requests:
-                matches = patterns.linkedin_partner_id.findall(req['url'])
-                for match in matches:
-                    partner_ids.add(match)
-            
-            result.identifiers = list(partner_ids)
+            result.identifiers = list(dict.fromkeys(
+                match for req in linkedin_requests for match in patterns.linkedin_partner_id.findall(req['url'])))
         
         # Check console logs for LinkedIn messages
-        linkedin_console_messages = [log for log in console_logs 
-                                    if any(keyword in log.lower() for keyword in ['linkedin', 'li_'])]
+        linkedin_console_count = self._console_message_count(console_logs, console_message_count)
         
-        if linkedin_console_messages:
+        if linkedin_console_count:
             result.confidence_score += 15
-            result.implementation_details.append(f'LinkedIn Insight console messages: {len(linkedin_console_messages)}')
+            result.implementation_details.append(f'LinkedIn Insight console messages: {linkedin_console_count}')
         
         # Check final DOM for LinkedIn elements
-        if patterns.linkedin_partner_id.search(dom_content) or patterns.linkedin_function.search(dom_content):
+        if (self._search_dom(patterns, 'linkedin_partner_id', dom_content, dom_matches) or
+                self._search_dom(patterns, 'linkedin_function', dom_content, dom_matches)):
             result.confidence_score += 20
             result.verification_checks.append('LinkedIn Insight Found in Final DOM')
         
@@ -1060,6 +1659,14 @@ class LinkedInInsightDetectorPlugin(TagDetectorPlugin):
 class SnapPixelDetectorPlugin(TagDetectorPlugin):
     """Snap Pixel detection plugin"""
     
+    __slots__ = ()
+    
+    # Lowercase substrings at least one of which every static detection path needs
+    signatures = ('snaptr', 'sc-static')
+    script_host = 'sc-static.net'
+    request_domains = ('sc-static.net',)
+    console_keywords = ('snapchat', 'snaptr', 'snap')
+    
     @property
     def name(self) -> str:
         return "Snap Pixel"
@@ -1068,18 +1675,23 @@ class SnapPixelDetectorPlugin(TagDetectorPlugin):
     def version(self) -> str:
         return "3.0.0"
     
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Progressive loading detection
-        result.progressive_loading_detected = self.detect_progressive_loading(html_content, patterns)
-        result.spa_detected = bool(patterns.spa_frameworks.search(html_content))
+        self._set_page_flags(result, page)
+        
+        # Skip the regexes entirely when none of the plugin's signatures occur
+        if not page.has_signature(self):
+            self._add_page_warnings(result)
+            return result
         
         # Pixel ID detection
-        pixel_ids = set()
-        for match in patterns.snap_pixel_id.finditer(html_content):
-            pixel_id = match.group(1)
-            pixel_ids.add(pixel_id)
+        pixel_ids = []
+        for match in page.finditer('snap_pixel_id'):
+            pixel_id = page.html[match.start(1):match.end(1)]
+            if pixel_id not in pixel_ids:
+                pixel_ids.append(pixel_id)
             result.confidence_score += 40
         
         if pixel_ids:
@@ -1087,53 +1699,51 @@ class SnapPixelDetectorPlugin(TagDetectorPlugin):
             result.detection_methods.append('Pixel ID Detection')
         
         # Script URL detection
-        for script in scripts:
+        for script in page.host_scripts(self.script_host):
             if script.get('src'):
-                if patterns.snap_script_url.search(script['src']):
+                if page.patterns.snap_script_url.search(script['src']):
                     result.confidence_score += 35
                     result.verification_checks.append('Snap Pixel Script URL Verified')
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        if patterns.snap_function.search(all_scripts):
+        if page.search_script('snap_function'):
             result.confidence_score += 20
             result.detection_methods.append('Snap Function Calls')
         
         # Dynamic script creation
-        if patterns.snap_dynamic.search(all_scripts):
+        if page.search_dynamic('snap_dynamic'):
             result.confidence_score += 30
             result.detection_methods.append('Dynamic Script Creation')
             result.loading_method = 'dynamic_insertion'
         
         # Noscript detection
-        noscript_match = patterns.snap_noscript.search(html_content)
+        noscript_match = page.search_noscript('snap_noscript')
         if noscript_match:
-            pixel_id = noscript_match.group(1)
-            pixel_ids.add(pixel_id)
+            pixel_id = page.html[noscript_match.start(1):noscript_match.end(1)]
+            if pixel_id not in pixel_ids:
+                pixel_ids.append(pixel_id)
             result.confidence_score += 10
             result.detection_methods.append('Noscript Detection')
         
         # Progressive loading warnings
-        if result.progressive_loading_detected:
-            result.warnings.append('Progressive loading detected - tags may load after user interaction')
-        
-        if result.spa_detected:
-            result.warnings.append('SPA framework detected - consider extended monitoring period')
+        self._add_page_warnings(result)
         
         if result.confidence_score >= 30:
             result.found = True
-            result.identifiers = list(pixel_ids)
+            result.identifiers = pixel_ids
         
         return result
     
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Check network requests for Snap Pixel
-        snap_requests = [req for req in network_requests 
-                        if 'sc-static.net' in req.get('url', '')]
+        snap_requests = self._tag_requests(network_requests, plugin_requests)
         
         if snap_requests:
             result.confidence_score += 50
@@ -1142,24 +1752,18 @@ class SnapPixelDetectorPlugin(TagDetectorPlugin):
             result.loading_method = 'javascript_execution'
             
             # Extract pixel IDs from requests
-            pixel_ids = set()
-            for req in snap_requests:
-                matches = patterns.snap_pixel_id.findall(req['url'])
-                for match in matches:
-                    pixel_ids.add(match)
-            
-            result.identifiers = list(pixel_ids)
+            result.identifiers = list(dict.fromkeys(
+                match for req in snap_requests for match in patterns.snap_pixel_id.findall(req['url'])))
         
         # Check console logs for Snap messages
-        snap_console_messages = [log for log in console_logs 
-                                if any(keyword in log.lower() for keyword in ['snapchat', 'snaptr', 'snap'])]
+        snap_console_count = self._console_message_count(console_logs, console_message_count)
         
-        if snap_console_messages:
+        if snap_console_count:
             result.confidence_score += 15
-            result.implementation_details.append(f'Snap Pixel console messages: {len(snap_console_messages)}')
+            result.implementation_details.append(f'Snap Pixel console messages: {snap_console_count}')
         
         # Check final DOM for Snap Pixel elements
-        if patterns.snap_pixel_id.search(dom_content):
+        if self._search_dom(patterns, 'snap_pixel_id', dom_content, dom_matches):
             result.confidence_score += 20
             result.verification_checks.append('Snap Pixel Found in Final DOM')
         
@@ -1171,6 +1775,14 @@ class SnapPixelDetectorPlugin(TagDetectorPlugin):
 class UniversalAnalyticsDetectorPlugin(TagDetectorPlugin):
     """Universal Analytics detection plugin"""
     
+    __slots__ = ()
+    
+    # Lowercase substrings at least one of which every static detection path needs
+    signatures = ('ua-', 'google-analytics', '"create"', "'create'", '"send"', "'send'")
+    script_host = 'www.google-analytics.com'
+    request_domains = ('google-analytics.com',)
+    console_keywords = ('google analytics', 'ga(', '_ga')
+    
     @property
     def name(self) -> str:
         return "Universal Analytics"
@@ -1179,66 +1791,68 @@ class UniversalAnalyticsDetectorPlugin(TagDetectorPlugin):
     def version(self) -> str:
         return "3.0.0"
     
-    def detect_static(self, html_content: str, scripts: List[Dict], patterns: CompiledPatterns) -> TagDetectionResult:
+    def detect_static(self, page: PageScan) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Progressive loading detection
-        result.progressive_loading_detected = self.detect_progressive_loading(html_content, patterns)
-        result.spa_detected = bool(patterns.spa_frameworks.search(html_content))
+        self._set_page_flags(result, page)
+        
+        # Skip the regexes entirely when none of the plugin's signatures occur
+        if not page.has_signature(self):
+            self._add_page_warnings(result)
+            return result
         
         # Tracking ID detection
-        tracking_ids = set()
-        for match in patterns.ua_tracking_id.finditer(html_content):
+        tracking_ids = []
+        for match in page.finditer('ua_tracking_id'):
             tracking_id = match.group(0).upper()
-            tracking_ids.add(tracking_id)
+            if tracking_id not in tracking_ids:
+                tracking_ids.append(tracking_id)
             result.confidence_score += 40
         
         if tracking_ids:
-            result.identifiers = list(tracking_ids)
+            result.identifiers = tracking_ids
             result.detection_methods.append('Tracking ID Detection')
         
         # Script URL detection
-        for script in scripts:
+        for script in page.host_scripts(self.script_host):
             if script.get('src'):
-                if patterns.ua_script_url.search(script['src']):
+                if page.patterns.ua_script_url.search(script['src']):
                     result.confidence_score += 35
                     result.verification_checks.append('UA Script URL Verified')
                     result.loading_method = 'direct_script'
         
         # Function calls
-        all_scripts = ' '.join([s.get('content', '') for s in scripts])
-        function_matches = patterns.ua_function.findall(all_scripts)
+        function_matches = page.findall_script('ua_function')
         if function_matches:
             result.confidence_score += len(function_matches) * 5
             result.detection_methods.append('GA Function Calls')
         
         # Dynamic script creation
-        if patterns.ua_dynamic.search(all_scripts):
+        if page.search_dynamic('ua_dynamic'):
             result.confidence_score += 30
             result.detection_methods.append('Dynamic Script Creation')
             result.loading_method = 'dynamic_insertion'
         
         # Progressive loading warnings
-        if result.progressive_loading_detected:
-            result.warnings.append('Progressive loading detected - tags may load after user interaction')
-        
-        if result.spa_detected:
-            result.warnings.append('SPA framework detected - consider extended monitoring period')
+        self._add_page_warnings(result)
         
         # Final determination
         if result.confidence_score >= 35:
             result.found = True
-            result.identifiers = list(tracking_ids)
+            result.identifiers = tracking_ids
         
         return result
     
     def detect_dynamic(self, network_requests: List[Dict], console_logs: List[str], 
-                      dom_content: str, patterns: CompiledPatterns) -> TagDetectionResult:
+                      dom_content: str, patterns: CompiledPatterns,
+                      plugin_requests: Optional[List[Dict]] = None,
+                      console_message_count: Optional[int] = None,
+                      dom_matches: Optional[Dict[int, List[Tuple[int, int]]]] = None) -> TagDetectionResult:
         result = TagDetectionResult()
         
         # Check network requests for Universal Analytics
-        ua_requests = [req for req in network_requests 
-                      if 'google-analytics.com' in req.get('url', '')]
+        ua_requests = self._tag_requests(network_requests, plugin_requests)
         
         if ua_requests:
             result.confidence_score += 50
@@ -1247,24 +1861,18 @@ class UniversalAnalyticsDetectorPlugin(TagDetectorPlugin):
             result.loading_method = 'javascript_execution'
             
             # Extract tracking IDs from requests
-            tracking_ids = set()
-            for req in ua_requests:
-                matches = patterns.ua_tracking_id.findall(req['url'])
-                for match in matches:
-                    tracking_ids.add(match.upper())
-            
-            result.identifiers = list(tracking_ids)
+            result.identifiers = list(dict.fromkeys(
+                match.upper() for req in ua_requests for match in patterns.ua_tracking_id.findall(req['url'])))
         
         # Check console logs for GA messages
-        ga_console_messages = [log for log in console_logs 
-                              if any(keyword in log.lower() for keyword in ['google analytics', 'ga(', '_ga'])]
+        ga_console_count = self._console_message_count(console_logs, console_message_count)
         
-        if ga_console_messages:
+        if ga_console_count:
             result.confidence_score += 15
-            result.implementation_details.append(f'GA console messages: {len(ga_console_messages)}')
+            result.implementation_details.append(f'GA console messages: {ga_console_count}')
         
         # Check final DOM for UA elements
-        if patterns.ua_tracking_id.search(dom_content):
+        if self._search_dom(patterns, 'ua_tracking_id', dom_content, dom_matches):
             result.confidence_score += 20
             result.verification_checks.append('UA Found in Final DOM')
         
@@ -1273,14 +1881,44 @@ class UniversalAnalyticsDetectorPlugin(TagDetectorPlugin):
         
         return result
     
+@dataclass(slots=True)
+class PageResponse:
+    """Status, decoded body and raw body of a fetched page, whichever HTTP client fetched it"""
+    status_code: int
+    text: str
+    content: bytes = b''
+    
+    def packed(self) -> 'PageResponse':
+        """This response for sending to another process; ASCII pages travel as raw bytes only"""
+        if len(self.content) == len(self.text) and self.content.isascii():
+            return PageResponse(self.status_code, '', self.content)
+        return self
+    
+    def unpacked(self) -> 'PageResponse':
+        """Inverse of packed, decoding the text back from an ASCII body"""
+        if not self.text and self.content:
+            return PageResponse(self.status_code, self.content.decode('ascii'), self.content)
+        return self
+
+@dataclass(slots=True)
+class DomainStats:
+    """JavaScript execution history of one domain, used to pick its timeout"""
+    attempts: int = 0
+    successes: int = 0
+    avg_load_time: float = 0.0
+    tag_count: int = 0
+
 class tagchecker:
     """Main Tag Checker class to manage detection plugins and patterns"""
     def __init__(self, use_javascript: bool = True, timeout: int = 20, max_workers: int = 2, 
-                 retry_config: RetryConfig = None):
+                 retry_config: RetryConfig = None, cpu_workers: int = 0):
         self.use_javascript = use_javascript and PLAYWRIGHT_AVAILABLE
         self.timeout = timeout
         self.max_workers = max_workers
-        self.patterns = CompiledPatterns()
+        # Processes running page detection during check_urls; 0 runs it in threads instead
+        self.cpu_workers = cpu_workers
+        self.cpu_pool = None
+        self.patterns = PATTERNS
         self.retry_config = retry_config or RetryConfig()
         
         # Plugin registry
@@ -1294,6 +1932,9 @@ class tagchecker:
             'snap_pixel': SnapPixelDetectorPlugin(),
             'universal_analytics': UniversalAnalyticsDetectorPlugin()
         }
+        self.build_console_matchers()
+        self.build_request_automaton()
+        self.build_signature_database()
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Safari/605.1.15",
@@ -1301,13 +1942,34 @@ class tagchecker:
             "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1",
             "Mozilla/5.0 (iPad; CPU OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
         ]
+        # Header sets are built once per user agent instead of on every request
+        self.request_headers = [self.build_headers(user_agent) for user_agent in self.user_agents]
         self.setup_logging()
-        self.domain_performance = {}
+        self.domain_performance: Dict[str, DomainStats] = {}
         self.timeout_strategy = {
             'default': 8000,
             'extended': 15000,
             'maximum': 30000
         }
+        
+        # Shared Chromium, launched on the first JavaScript execution and closed by shutdown()
+        self.playwright = None
+        self.browser = None
+        self.browser_lock = None
+        self.create_semaphores()
+        
+        # Keep-alive requests sessions for the fallback fetch path, one per worker thread
+        self.http_sessions = threading.local()
+        
+        # Static results of recently seen page bodies; detect_page runs in several threads at once
+        self.static_cache: 'OrderedDict[int, Dict[str, TagDetectionResult]]' = OrderedDict()
+        self.static_cache_lock = threading.Lock()
+    
+    def create_semaphores(self):
+        """Separate concurrency limits for browser sessions and for the much cheaper page fetches"""
+        self.js_semaphore = asyncio.Semaphore(self.max_workers)
+        self.http_semaphore = asyncio.Semaphore(self.max_workers * 8)
+    
     def setup_logging(self):
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
@@ -1315,12 +1977,20 @@ class tagchecker:
     def register_plugin(self, name: str, plugin: TagDetectorPlugin):
         """Register a new tag detection plugin"""
         self.plugins[name] = plugin
+        with self.static_cache_lock:
+            self.static_cache.clear()
+        self.build_console_matchers()
+        self.build_request_automaton()
+        self.build_signature_database()
         self.logger.info(f"Registered plugin: {plugin.name} v{plugin.version}")
     
     def get_headers(self) -> Dict[str, str]:
-        import random
+        """Headers for one request with a random user agent; shared, so callers must not modify them"""
+        return random.choice(self.request_headers)
+    
+    def build_headers(self, user_agent: str) -> Dict[str, str]:
         return {
-            'User-Agent': random.choice(self.user_agents),
+            'User-Agent': user_agent,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate, br',
@@ -1329,118 +1999,147 @@ class tagchecker:
             'Upgrade-Insecure-Requests': '1'
         }
     
+    async def get_browser(self):
+        """The shared Chromium browser, (re)launched when none is connected"""
+        if self.browser_lock is None:
+            self.browser_lock = asyncio.Lock()
+        async with self.browser_lock:
+            if self.playwright is None:
+                self.playwright = await async_playwright().start()
+            if self.browser is None or not self.browser.is_connected():
+                self.browser = await self.playwright.chromium.launch(headless=True)
+        return self.browser
+    
+    async def shutdown(self):
+        """Close the shared browser and stop Playwright, if they were started"""
+        if self.browser is not None:
+            await self.browser.close()
+            self.browser = None
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+        self.browser_lock = None
+    
     async def execute_javascript_with_progressive_loading(self, url: str) -> Dict[str, Any]:
         domain = urlparse(url).netloc
         base_timeout = self._get_domain_timeout(domain)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent=self.get_headers()['User-Agent'],
-                viewport={'width': 1920, 'height': 1080}
-            )
+        browser = await self.get_browser()
+        context = await browser.new_context(
+            user_agent=random.choice(self.user_agents),
+            viewport={'width': 1920, 'height': 1080}
+        )
+        
+        # Initialize tracking
+        tag_requests = []
+        console_logs = []
+        document = None
+        performance_metrics = {
+            'time_to_first_tag': None,
+            'total_tag_requests': 0,
+            'tag_load_complete': False
+        }
 
-            # Block non-essential resources
-            await context.route("**/*.{png,jpg,jpeg,gif,svg,css,woff,woff2}", 
-                              lambda route: route.abort())
+        async def handle_request(request):
+            if any(domain in request.url for domain in self.patterns.tag_domains):
+                tag_requests.append({
+                    'url': request.url,
+                    'timestamp': time.time(),
+                    'resource_type': request.resource_type
+                })
+                if performance_metrics['time_to_first_tag'] is None:
+                    performance_metrics['time_to_first_tag'] = time.time()
 
+        try:
             page = await context.new_page()
             
-            # Initialize tracking
-            tag_requests = []
-            console_logs = []
-            performance_metrics = {
-                'time_to_first_tag': None,
-                'total_tag_requests': 0,
-                'tag_load_complete': False
-            }
-
-            async def handle_request(request):
-                if any(domain in request.url for domain in self.patterns.tag_domains):
-                    tag_requests.append({
-                        'url': request.url,
-                        'timestamp': time.time(),
-                        'resource_type': request.resource_type
-                    })
-                    if performance_metrics['time_to_first_tag'] is None:
-                        performance_metrics['time_to_first_tag'] = time.time()
-
+            # Block non-essential resources in the browser; routing them through Playwright
+            # would disable the HTTP cache
+            client = await context.new_cdp_session(page)
+            await client.send('Network.enable')
+            await client.send('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+            await client.send('Network.setCacheDisabled', {'cacheDisabled': False})
             page.on('request', handle_request)
             page.on('console', lambda msg: console_logs.append(msg.text))
 
-            try:
-                # Stage 1: Initial load
-                await page.goto(url, wait_until='domcontentloaded', 
-                              timeout=base_timeout)
-                
-                # Stage 2: Wait for initial scripts
-                await page.wait_for_load_state('domcontentloaded')
-                initial_content = await page.content()
-
-                # Stage 3: Progressive waiting
-                exit_conditions = False
-                start_time = time.time()
-                check_interval = 500
-
-                while not exit_conditions and (time.time() - start_time) < base_timeout/1000:
-                    # Check for tag presence
-                    current_content = await page.content()
-                    
-                    # Check for key functions
-                    has_tracking = await page.evaluate("""
-                        () => ({
-                            dataLayer: !!window.dataLayer,
-                            gtag: !!window.gtag,
-                            fbq: !!window.fbq,
-                            ttq: !!window.ttq,
-                            snaptr: !!window.snaptr
-                        })
-                    """)
-
-                    if any(has_tracking.values()):
-                        break
-
-                    # Check tag requests
-                    if len(tag_requests) > 0 and (time.time() - tag_requests[-1]['timestamp']) > 2:
-                        break
-
-                    # Simulate user interaction
-                    if time.time() - start_time > 5:
-                        await page.evaluate('window.scrollTo(0, document.body.scrollHeight / 2)')
-                        await page.mouse.move(500, 300)
-
-                    await page.wait_for_timeout(check_interval)
-
-                # Update domain performance
-                self._update_domain_performance(domain, time.time() - start_time, len(tag_requests))
-
-                return {
-                    'network_requests': tag_requests,
-                    'console_logs': console_logs,
-                    'final_dom': await page.content(),
-                    'performance_metrics': performance_metrics,
-                    'success': True
-                }
+            # Stage 1: Initial load; the document response doubles as the static fetch
+            main_response = await page.goto(url, wait_until='domcontentloaded', 
+                                            timeout=base_timeout)
+            if main_response is not None:
+                document = PageResponse(main_response.status, await main_response.text(),
+                                        await main_response.body())
+            
+            # Stage 2: Wait for initial scripts
+            await page.wait_for_load_state('domcontentloaded')
+            initial_content = await page.content()
 
-            except Exception as e:
-                self.logger.error(f"Error executing JavaScript: {str(e)}")
-                return {
-                    'network_requests': tag_requests,
-                    'console_logs': console_logs,
-                    'final_dom': initial_content if 'initial_content' in locals() else '',
-                    'performance_metrics': performance_metrics,
-                    'success': False,
-                    'error': str(e)
-                }
-            finally:
-                await browser.close()
+            # Stage 3: Progressive waiting
+            exit_conditions = False
+            start_time = time.time()
+            check_interval = 250
+            interacted = False
+
+            while not exit_conditions and (time.time() - start_time) < base_timeout/1000:
+                # Check for key functions, scrolling in the same call when it is time to interact;
+                # a single boolean crosses the bridge
+                interact = not interacted and time.time() - start_time > 5
+                has_tracking = await page.evaluate(
+                    """(interact) => {
+                        const found = !!(window.dataLayer || window.gtag || window.fbq || window.ttq || window.snaptr);
+                        if (interact && !found) window.scrollTo(0, document.body.scrollHeight / 2);
+                        return found;
+                    }""",
+                    interact
+                )
+
+                if has_tracking:
+                    break
+
+                # Check tag requests
+                if len(tag_requests) > 0 and (time.time() - tag_requests[-1]['timestamp']) > 2:
+                    break
+
+                # Simulate user interaction; repeating the same scroll and mouse position does nothing
+                if interact:
+                    await page.mouse.move(500, 300)
+                    interacted = True
+
+                # Back off between polls; the DOM is serialized only once, after the loop
+                await page.wait_for_timeout(check_interval)
+                check_interval = min(check_interval * 2, 2000)
+
+            # Update domain performance
+            self._update_domain_performance(domain, time.time() - start_time, len(tag_requests))
+
+            return {
+                'network_requests': tag_requests,
+                'console_logs': console_logs,
+                'final_dom': await page.content(),
+                'document': document,
+                'performance_metrics': performance_metrics,
+                'success': True
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error executing JavaScript: {str(e)}")
+            return {
+                'network_requests': tag_requests,
+                'console_logs': console_logs,
+                'final_dom': initial_content if 'initial_content' in locals() else '',
+                'performance_metrics': performance_metrics,
+                'success': False,
+                'error': str(e)
+            }
+        finally:
+            await context.close()
 
     def _get_domain_timeout(self, domain: str) -> int:
         """Get appropriate timeout based on domain performance history"""
-        if domain not in self.domain_performance:
+        stats = self.domain_performance.get(domain)
+        if stats is None:
             return self.timeout_strategy['default']
         
-        avg_load_time = self.domain_performance[domain]['avg_load_time']
+        avg_load_time = stats.avg_load_time
         if avg_load_time > 12:
             return self.timeout_strategy['maximum']
         elif avg_load_time > 6:
@@ -1449,24 +2148,43 @@ class tagchecker:
 
     def _update_domain_performance(self, domain: str, load_time: float, tag_count: int):
         """Update domain performance metrics"""
-        if domain not in self.domain_performance:
-            self.domain_performance[domain] = {
-                'attempts': 0,
-                'successes': 0,
-                'avg_load_time': 0,
-                'tag_count': 0
-            }
+        stats = self.domain_performance.get(domain)
+        if stats is None:
+            stats = self.domain_performance[domain] = DomainStats()
         
-        stats = self.domain_performance[domain]
-        stats['attempts'] += 1
-        stats['successes'] += 1
-        stats['avg_load_time'] = (stats['avg_load_time'] * (stats['attempts'] - 1) + load_time) / stats['attempts']
-        stats['tag_count'] = max(stats['tag_count'], tag_count)
+        stats.attempts += 1
+        stats.successes += 1
+        # Incremental mean, without re-multiplying the running total
+        stats.avg_load_time += (load_time - stats.avg_load_time) / stats.attempts
+        if tag_count > stats.tag_count:
+            stats.tag_count = tag_count
     
     def extract_static_content(self, html_content: str) -> Dict[str, Any]:
-        """Extract static content for analysis"""
+        """Extract static content for analysis (only <script> elements are built into the tree)"""
+        if LXML_AVAILABLE:
+            try:
+                tree = lxml.html.fromstring(html_content)
+            except Exception:
+                # Empty documents and strings carrying an encoding declaration go through BeautifulSoup
+                tree = None
+            if tree is not None:
+                return {'scripts': [
+                    {
+                        'src': script.get('src', ''),
+                        'content': script.text or '',
+                        'type': script.get('type', ''),
+                        'async': 'async' in script.attrib,
+                        'defer': 'defer' in script.attrib
+                    }
+                    for script in tree.iter('script')
+                ]}
+        else:
+            scripts = self.scan_script_elements(html_content)
+            if scripts is not None:
+                return {'scripts': scripts}
+        
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=SCRIPT_STRAINER)
         except Exception:
             soup = None
         
@@ -1483,18 +2201,293 @@ class tagchecker:
         
         return {'scripts': scripts}
     
-    async def fetch_url_with_retry(self, url: str) -> requests.Response:
-        """Fetch URL with retry logic"""
-        def fetch():
-            if not url.startswith(('http://', 'https://')):
-                full_url = 'https://' + url
-            else:
-                full_url = url
-            return requests.get(full_url, headers=self.get_headers(), timeout=self.timeout)
+    def scan_script_elements(self, html_content: str) -> Optional[List[Dict]]:
+        """<script> elements found by one regex pass, without building a tree.
         
-        return retry_sync(fetch, retry_config=self.retry_config)
+        None when some <script opening tag is not part of a complete element (unclosed scripts,
+        markup written from inside a script); BeautifulSoup handles those pages.
+        """
+        elements = [match.groups() for match in SCRIPT_ELEMENT.finditer(html_content) if match.group(2) is not None]
+        if len(elements) != sum(1 for tag in SCRIPT_OPEN_TAG.findall(html_content) if tag):
+            return None
+        
+        scripts = []
+        for attribute_text, content in elements:
+            attributes = {}
+            for name, double_quoted, single_quoted, unquoted in SCRIPT_ATTRIBUTE.findall(attribute_text):
+                attributes.setdefault(name.lower(), unescape(double_quoted or single_quoted or unquoted))
+            scripts.append({
+                'src': attributes.get('src', ''),
+                'content': content,
+                'type': attributes.get('type', ''),
+                'async': 'async' in attributes,
+                'defer': 'defer' in attributes
+            })
+        return scripts
+    
+    def scan_page(self, html_content: str, scripts: List[Dict], html_bytes: Optional[bytes] = None) -> PageScan:
+        """One shared pass over a page for every plugin's detect_static.
+        
+        The HTML and the joined inline scripts are each scanned once for every vendor's
+        patterns; plugins then only run the regexes those scans could not rule out.
+        The progressive loading and SPA flags and every plugin's signature gate are likewise
+        computed once per page.
+        """
+        all_scripts = ' '.join([s.get('content', '') for s in scripts])
+        spa = bool(self.patterns.spa_frameworks.search(html_content))
+        return PageScan(
+            html=html_content,
+            scripts=scripts,
+            patterns=self.patterns,
+            html_lower=html_content.lower(),
+            all_scripts=all_scripts,
+            scripts_by_host=self.group_scripts_by_host(scripts),
+            matches=HTML_PATTERN_DB.scan(html_content, html_bytes),
+            script_matches=SCRIPT_PATTERN_DB.scan(all_scripts),
+            progressive_loading=spa or bool(self.patterns.progressive_loading.search(html_content)),
+            spa=spa,
+            signature_plugins=self.find_signature_plugins(html_content, html_bytes)
+        )
+    
+    def detect_all_static(self, html_content: str, scripts: List[Dict],
+                          html_bytes: Optional[bytes] = None) -> Dict[str, TagDetectionResult]:
+        """Static detection for every plugin from one shared scan_page of the page"""
+        page = self.scan_page(html_content, scripts, html_bytes)
+        return {plugin_name: plugin.detect_static(page) for plugin_name, plugin in self.plugins.items()}
+    
+    def detect_all_dynamic(self, network_requests: List[Dict], console_logs: List[str],
+                           dom_content: str) -> Dict[str, TagDetectionResult]:
+        """Dynamic detection for every plugin, with the network requests classified and the final DOM scanned once"""
+        # Nothing captured (navigation failed early): every plugin would return an empty result
+        if not network_requests and not console_logs and not dom_content:
+            return {plugin_name: TagDetectionResult() for plugin_name in self.plugins}
+        
+        requests_by_plugin = self.classify_requests(network_requests)
+        console_counts = self.count_console_messages(console_logs)
+        dom_matches = HTML_PATTERN_DB.scan(dom_content)
+        
+        return {
+            plugin_name: plugin.detect_dynamic(
+                network_requests,
+                console_logs,
+                dom_content,
+                self.patterns,
+                plugin_requests=requests_by_plugin[plugin_name],
+                console_message_count=console_counts[plugin_name],
+                dom_matches=dom_matches
+            )
+            for plugin_name, plugin in self.plugins.items()
+        }
     
-    async def analyze_url_comprehensive(self, url: str) -> Dict[str, Any]:
+    def build_signature_database(self):
+        """One Hyperscan database over every plugin's signatures; pattern ids index signature_owners"""
+        self.signature_database = None
+        self.signature_scratch = threading.local()
+        self.signature_owners = [plugin for plugin in self.plugins.values() for _ in plugin.signatures]
+        if not HYPERSCAN_AVAILABLE or not self.signature_owners:
+            return
+        self.signature_database = compile_signature_database(
+            tuple(signature for plugin in self.plugins.values() for signature in plugin.signatures))
+    
+    def find_signature_plugins(self, html_content: str, html_bytes: Optional[bytes] = None) -> Optional[Set[TagDetectorPlugin]]:
+        """Plugins with a signature on the page, from one case-insensitive scan; None without Hyperscan"""
+        if self.signature_database is None:
+            return None
+        # str.lower() turns these into ASCII letters and the byte scan does not; such pages are
+        # left to the plugins' own substring checks
+        if not html_content.isascii() and ('\u0130' in html_content or '\u212a' in html_content):
+            return None
+        
+        data = html_bytes
+        if data is None or len(data) != len(html_content):
+            data = html_content.encode('utf-8', errors='replace')
+        
+        found = set()
+        total = len(set(self.signature_owners))
+        
+        def on_match(pattern_id, start, end, flags, context):
+            found.add(self.signature_owners[pattern_id])
+            # Returning True halts the scan once every plugin has been seen
+            return len(found) == total
+        
+        try:
+            self.signature_database.scan(data, match_event_handler=on_match,
+                                         scratch=thread_scratch(self.signature_database, self.signature_scratch))
+        except hyperscan.ScanTerminated:
+            pass
+        return found
+    
+    def build_console_matchers(self):
+        """Match every plugin's console keywords in one pass per message.
+        
+        Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise one regex of
+        lookaheads whose longest keyword at a position also credits the keywords it starts with.
+        """
+        keyword_owners = {}
+        for plugin_name, plugin in self.plugins.items():
+            for keyword in plugin.console_keywords:
+                keyword_owners.setdefault(keyword, set()).add(plugin_name)
+        
+        self.console_automaton = None
+        self.console_pattern = None
+        self.console_keyword_owners = {}
+        if not keyword_owners:
+            return
+        
+        if AHOCORASICK_AVAILABLE:
+            self.console_automaton = ahocorasick.Automaton()
+            for keyword, plugin_names in keyword_owners.items():
+                self.console_automaton.add_word(keyword, frozenset(plugin_names))
+            self.console_automaton.make_automaton()
+            return
+        
+        self.console_pattern, self.console_keyword_owners = compile_keyword_lookahead(keyword_owners)
+    
+    def count_console_messages(self, console_logs: List[str]) -> Dict[str, int]:
+        """Per plugin, how many console messages mention one of its keywords, in one pass per message"""
+        counts = dict.fromkeys(self.plugins, 0)
+        if self.console_automaton is None and self.console_pattern is None:
+            return counts
+        
+        for log in console_logs:
+            # Each message is lowercased once for every plugin
+            log_lower = log.lower()
+            owners = set()
+            if self.console_automaton is not None:
+                for _, plugin_names in self.console_automaton.iter(log_lower):
+                    owners |= plugin_names
+            else:
+                for keyword in self.console_pattern.findall(log_lower):
+                    owners |= self.console_keyword_owners[keyword]
+            for plugin_name in owners:
+                counts[plugin_name] += 1
+        return counts
+    
+    def build_request_automaton(self):
+        """Match every plugin's request domains in one pass per URL.
+        
+        Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise one regex of
+        lookaheads over all domains.
+        """
+        domain_owners = {}
+        for plugin_name, plugin in self.plugins.items():
+            for domain in plugin.request_domains:
+                domain_owners.setdefault(domain, set()).add(plugin_name)
+        
+        self.request_automaton = None
+        self.request_pattern = None
+        self.request_domain_owners = {}
+        if not domain_owners:
+            return
+        
+        if not AHOCORASICK_AVAILABLE:
+            self.request_pattern, self.request_domain_owners = compile_keyword_lookahead(domain_owners)
+            return
+        self.request_automaton = ahocorasick.Automaton()
+        for domain, plugin_names in domain_owners.items():
+            self.request_automaton.add_word(domain, frozenset(plugin_names))
+        self.request_automaton.make_automaton()
+    
+    def classify_requests(self, network_requests: List[Dict]) -> Dict[str, List[Dict]]:
+        """Per plugin, the captured requests whose URL contains one of its domains, in capture order.
+        
+        Each URL is read from its request once and scanned once, however many plugins there are.
+        """
+        requests_by_plugin = {plugin_name: [] for plugin_name in self.plugins}
+        if self.request_automaton is None and self.request_pattern is None:
+            return requests_by_plugin
+        
+        for url, request in ((request.get('url', ''), request) for request in network_requests):
+            owners = set()
+            if self.request_automaton is not None:
+                for _, plugin_names in self.request_automaton.iter(url):
+                    owners |= plugin_names
+            else:
+                for domain in self.request_pattern.findall(url):
+                    owners |= self.request_domain_owners[domain]
+            for plugin_name in owners:
+                requests_by_plugin[plugin_name].append(request)
+        return requests_by_plugin
+    
+    def group_scripts_by_host(self, scripts: List[Dict]) -> Dict[str, List[Dict]]:
+        """Bucket external scripts by every https:// host in their src, keeping page order"""
+        scripts_by_host = defaultdict(list)
+        for script in scripts:
+            src = script.get('src')
+            if not src:
+                continue
+            for host in dict.fromkeys(h.lower() for h in self.patterns.script_host.findall(src)):
+                scripts_by_host[host].append(script)
+        return scripts_by_host
+    
+    async def fetch_url_with_retry(self, url: str, session=None) -> PageResponse:
+        """Fetch URL with retry logic, on the shared aiohttp session when one is given"""
+        if not url.startswith(('http://', 'https://')):
+            full_url = 'https://' + url
+        else:
+            full_url = url
+        
+        if session is not None:
+            async def fetch_async():
+                async with session.get(full_url, headers=self.get_headers()) as response:
+                    content = await response.read()
+                    return PageResponse(response.status, await response.text(errors='replace'), content)
+            
+            return await retry_async(fetch_async, retry_config=self.retry_config)
+        
+        def fetch():
+            http_session = getattr(self.http_sessions, 'session', None)
+            if http_session is None:
+                http_session = self.http_sessions.session = requests.Session()
+            response = http_session.get(full_url, headers=self.get_headers(), timeout=self.timeout)
+            return PageResponse(response.status_code, response.text, response.content)
+        
+        # Keep the blocking client off the event loop so concurrent analyses overlap; only the
+        # attempts run in a thread, the backoff between them sleeps on the loop
+        return await retry_async(asyncio.to_thread, fetch, retry_config=self.retry_config)
+    
+    def static_cache_key(self, response: PageResponse) -> int:
+        """Hash of the page body"""
+        body = response.content or response.text.encode('utf-8', errors='replace')
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_intdigest(body)
+        return hash(body)
+    
+    def detect_page(self, response: PageResponse, dynamic_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Parse the page and run every plugin's static and dynamic detection, merged per plugin"""
+        # Pages built from the same template share a body, and with it their static results;
+        # merge_results never modifies its inputs, so cached results can be reused as they are
+        cache_key = self.static_cache_key(response)
+        with self.static_cache_lock:
+            static_results = self.static_cache.get(cache_key)
+            if static_results is not None:
+                self.static_cache.move_to_end(cache_key)
+        
+        if static_results is None:
+            html_content = without_lone_surrogates(response.text)
+            # The raw body no longer matches the text once surrogates have been replaced
+            html_bytes = response.content if html_content is response.text else None
+            static_content = self.extract_static_content(html_content)
+            static_results = self.detect_all_static(html_content, static_content['scripts'], html_bytes)
+            with self.static_cache_lock:
+                self.static_cache[cache_key] = static_results
+                if len(self.static_cache) > STATIC_CACHE_SIZE:
+                    self.static_cache.popitem(last=False)
+        
+        dynamic_results = self.detect_all_dynamic(
+            dynamic_data['network_requests'],
+            [without_lone_surrogates(message) for message in dynamic_data['console_logs']],
+            without_lone_surrogates(dynamic_data['final_dom'])
+        )
+        
+        detection_results = {}
+        for plugin_name, plugin in self.plugins.items():
+            final_result = plugin.merge_results(static_results[plugin_name], dynamic_results[plugin_name])
+            # Shallow projection: merge_results built fresh lists, so there is nothing to deep-copy
+            detection_results[plugin_name] = {name: getattr(final_result, name) for name in RESULT_FIELDS}
+        return detection_results
+    
+    async def analyze_url_comprehensive(self, url: str, session=None) -> Dict[str, Any]:
         """Comprehensive URL analysis with static and dynamic detection"""
         start_time = time.time()
         
@@ -1512,8 +2505,25 @@ class tagchecker:
         }
         
         try:
-            # Static analysis with retry
-            response = await self.fetch_url_with_retry(url)
+            response = None
+            
+            # Execute JavaScript with progressive loading detection if enabled
+            if self.use_javascript:
+                async with self.js_semaphore:
+                    js_result = await retry_async(
+                        self.execute_javascript_with_progressive_loading, 
+                        url, 
+                        retry_config=self.retry_config
+                    )
+                dynamic_data = js_result
+                result['progressive_loading_detected'] = js_result.get('progressive_loading_detected', False)
+                # The browser's document response replaces a second fetch of the same page
+                response = js_result.get('document')
+            
+            # Static analysis with retry, when the browser did not provide the document
+            if response is None:
+                async with self.http_semaphore:
+                    response = await self.fetch_url_with_retry(url, session)
             result['response_code'] = response.status_code
             
             if response.status_code != 200:
@@ -1521,19 +2531,7 @@ class tagchecker:
                 result['error'] = f'HTTP {response.status_code}'
                 return result
             
-            # Extract static content
-            static_content = self.extract_static_content(response.text)
-            
-            # Execute JavaScript with progressive loading detection if enabled
-            if self.use_javascript:
-                js_result = await retry_async(
-                    self.execute_javascript_with_progressive_loading, 
-                    url, 
-                    retry_config=self.retry_config
-                )
-                dynamic_data = js_result
-                result['progressive_loading_detected'] = js_result.get('progressive_loading_detected', False)
-            else:
+            if not self.use_javascript:
                 dynamic_data = {
                     'network_requests': [], 
                     'console_logs': [], 
@@ -1541,33 +2539,28 @@ class tagchecker:
                     'progressive_loading_detected': False
                 }
             
-            # Run all plugins
-            for plugin_name, plugin in self.plugins.items():
-                static_result = plugin.detect_static(
-                    response.text, 
-                    static_content['scripts'], 
-                    self.patterns
-                )
-                
-                dynamic_result = plugin.detect_dynamic(
-                    dynamic_data['network_requests'],
-                    dynamic_data['console_logs'],
-                    dynamic_data['final_dom'],
-                    self.patterns
-                )
-                
-                # Merge results
-                final_result = plugin.merge_results(static_result, dynamic_result)
-                result['detection_results'][plugin_name] = asdict(final_result)
+            # Run all plugins off the event loop so other URLs keep fetching meanwhile
+            if self.cpu_pool is not None:
+                page_data = {key: dynamic_data[key] for key in ('network_requests', 'console_logs', 'final_dom')}
+                result['detection_results'] = await asyncio.get_running_loop().run_in_executor(
+                    self.cpu_pool, detect_page_in_worker, response.packed(), page_data)
+            else:
+                result['detection_results'] = await asyncio.to_thread(self.detect_page, response, dynamic_data)
             
             # Add performance metrics
             result['page_load_time'] = round(time.time() - start_time, 2)
             
-            # Add warnings for late loading indicators
-            if self.patterns.consent_managers.search(response.text):
+            # Add warnings for late loading indicators, found in one scan that stops once both are seen
+            indicators = set()
+            for match in self.patterns.late_loading.finditer(response.text):
+                indicators.add(match.lastgroup)
+                if len(indicators) == 2:
+                    break
+            
+            if 'consent' in indicators:
                 result['warnings'].append('Consent management detected - tags may load after user interaction')
             
-            if self.patterns.lazy_loading.search(response.text):
+            if 'lazy' in indicators:
                 result['warnings'].append('Lazy loading detected - some tags may load after viewport interaction')
             
             if result['progressive_loading_detected']:
@@ -1581,130 +2574,139 @@ class tagchecker:
         return result
     
     async def check_urls_async(self, urls: List[str]) -> List[Dict[str, Any]]:
-        """Asynchronous URL checking with semaphore for rate limiting"""
-        semaphore = asyncio.Semaphore(self.max_workers)
-        
-        async def check_single_with_semaphore(url):
-            async with semaphore:
-                return await self.analyze_url_comprehensive(url)
+        """Asynchronous URL checking; fetches and browser sessions are each rate limited by a semaphore"""
+        # Fresh semaphores for this run's event loop
+        self.create_semaphores()
+        if self.cpu_workers:
+            # Spawned workers do not inherit this process's threads, locks or event loop
+            self.cpu_pool = ProcessPoolExecutor(
+                max_workers=self.cpu_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_detection_worker,
+                initargs=(self.plugins,)
+            )
+        session = None
+        if AIOHTTP_AVAILABLE:
+            # One pooled session per crawl, shared by every fetch
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=4, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
         
-        tasks = [check_single_with_semaphore(url) for url in urls]
         results = []
+        reported = 0
+        
+        def print_progress():
+            nonlocal reported
+            if len(results) != reported:
+                reported = len(results)
+                print(f"Progress: {reported}/{len(urls)} URLs analyzed")
+        
+        async def analyze(url: str):
+            # Results are collected in completion order
+            results.append(await self.analyze_url_comprehensive(url, session))
         
-        completed = 0
-        for coro in asyncio.as_completed(tasks):
-            result = await coro
-            results.append(result)
-            completed += 1
-            print(f"Progress: {completed}/{len(urls)} URLs analyzed")
+        async def report_progress():
+            # Progress is printed at most twice a second rather than on every completion
+            while True:
+                await asyncio.sleep(0.5)
+                print_progress()
         
+        reporter = asyncio.create_task(report_progress())
+        try:
+            async with asyncio.TaskGroup() as group:
+                for url in urls:
+                    group.create_task(analyze(url))
+        finally:
+            reporter.cancel()
+            if session is not None:
+                await session.close()
+            if self.cpu_pool is not None:
+                # Waiting for the workers to exit would otherwise block the event loop
+                await asyncio.to_thread(self.cpu_pool.shutdown)
+                self.cpu_pool = None
+            await self.shutdown()
+        
+        print_progress()
         return results
     
     def check_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
         """Main entry point for checking URLs"""
-        if self.use_javascript:
-            # Use async event loop for JavaScript execution
-            return asyncio.run(self.check_urls_async(urls))
-        else:
-            # Use thread pool for static-only analysis
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = [executor.submit(asyncio.run, self.analyze_url_comprehensive(url)) 
-                          for url in urls]
-                results = []
-                for i, future in enumerate(as_completed(futures)):
-                    results.append(future.result())
-                    print(f"Progress: {i+1}/{len(urls)} URLs analyzed")
-                return results
+        # Static and JavaScript analysis share one event loop
+        return asyncio.run(self.check_urls_async(urls))
     def save_comprehensive_results(self, results: List[Dict[str, Any]], filename: str = 'results.csv'):
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            # Dynamic fieldnames based on available plugins
-            base_fields = ['url', 'status', 'response_code', 'javascript_executed']
-            plugin_fields = []
-            for plugin_name in self.plugins.keys():
-                plugin_fields.extend([
-                    f"{plugin_name}_found",
-                    f"{plugin_name}_confidence_score",
-                    f"{plugin_name}_identifiers",
-                    f"{plugin_name}_detection_methods",
-                    f"{plugin_name}_verification_checks"
-                ])
-            all_fields = base_fields + plugin_fields
-            writer = csv.DictWriter(csvfile, fieldnames=all_fields)
-            writer.writeheader()
-            for result in results:
-                csv_row = {field: result.get(field, '') for field in base_fields}
-                for plugin_name in self.plugins.keys():
-                    plugin_result = result.get('detection_results', {}).get(plugin_name, {})
-                    csv_row[f"{plugin_name}_found"] = plugin_result.get('found', False)
-                    csv_row[f"{plugin_name}_confidence_score"] = plugin_result.get('confidence_score', 0)
-                    csv_row[f"{plugin_name}_identifiers"] = ', '.join(plugin_result.get('identifiers', []))
-                    csv_row[f"{plugin_name}_detection_methods"] = ', '.join(plugin_result.get('detection_methods', []))
-                    csv_row[f"{plugin_name}_verification_checks"] = ', '.join(plugin_result.get('verification_checks', []))
-                writer.writerow(csv_row)
+        # Dynamic fieldnames based on available plugins
+        base_fields = ('url', 'status', 'response_code', 'javascript_executed')
+        plugin_names = list(self.plugins)
+        header = list(base_fields)
+        for plugin_name in plugin_names:
+            header.extend([
+                f"{plugin_name}_found",
+                f"{plugin_name}_confidence_score",
+                f"{plugin_name}_identifiers",
+                f"{plugin_name}_detection_methods",
+                f"{plugin_name}_verification_checks"
+            ])
+        
+        def csv_row(result: Dict[str, Any]) -> List[Any]:
+            """Positional row in header order"""
+            row = [result.get(field, '') for field in base_fields]
+            detection_results = result.get('detection_results', {})
+            for plugin_name in plugin_names:
+                plugin_result = detection_results.get(plugin_name, {})
+                row.extend((
+                    plugin_result.get('found', False),
+                    plugin_result.get('confidence_score', 0),
+                    ', '.join(plugin_result.get('identifiers', [])),
+                    ', '.join(plugin_result.get('detection_methods', [])),
+                    ', '.join(plugin_result.get('verification_checks', []))
+                ))
+            return row
+        
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(header)
+            writer.writerows(csv_row(result) for result in results)
 
         print(f"Comprehensive results saved to {filename}")
 
-class testcompiledpatterns:
-    def run_tests(self):
-        patterns = CompiledPatterns()
-        test_strings = {
-            'gtm_container_id': ['GTM-ABC123', 'gtm-xyz789', 'GTM-1234', 'GTM-TOOLONGID12345'],
-            'gtm_script_url': ['https://www.googletagmanager.com/gtm.js?id=GTM-ABC123', 
-                               'http://googletagmanager.com/gtm.js?id=GTM-XYZ789'],
-            'gtm_init_code': ["<script>function gtag(){dataLayer.push(arguments);}</script>"],
-            'gtm_datalayer': ['dataLayer = [];', 'var dataLayer = [];'],
-            'gtm_dynamic': ["var script = document.createElement('script'); script.src = 'https://www.googletagmanager.com/gtm.js?id=GTM-ABC123';"],
-            'gtm_noscript': ['<noscript><iframe src="https://www.googletagmanager.com/ns.html?id=GTM-ABC123"></iframe></noscript>'],
-            'tealium_url': ['https://tags.tiqcdn.com/utag/account/profile/env/utag.js'],
-            'tealium_utag_data': ['var utag_data = {};', 'utag_data.page_name = "Home";'],
-            'tealium_async': ["(function(a,b,c,d){var e=...;})"],
-            'tealium_functions': ['utag.view();', 'utag.link();'],
-            'tealium_dynamic': ["var s=document.createElement('script'); s.src='https://tags.tiqcdn.com/utag/account/profile/env/utag.js';"],
-            'ua_tracking_id': ['UA-12345678-1', 'ua-87654321-2'],
-            'ua_script_url': ['https://www.google-analytics.com/analytics.js', 
-                              'http://www.google-analytics.com/ga.js'],
-            'ua_function': ['ga("create", "UA-12345678-1", "auto");', "ga('send', 'pageview');"],
-            'ua_dynamic': ["var gaScript = document.createElement('script'); gaScript.src = 'https://www.google-analytics.com/analytics.js';"],
-            'gtag': ['<script async src="https://www.googletagmanager.com/gtag/js?id=GA-12345678-1"></script>'],
-            'metapixel': ['<script src="https://connect.facebook.net/en_US/fbevents.js"></script>'],
-            'tiktokpixel': ['<script src="https://analytics.tiktok.com/i18n/pixel/sdk.js"></script>'],
-            'linkedininsight': ['<script src="https://snap.licdn.com/li.lms-analytics/insight.min.js"></script>'],
-            'snappixel': ['<script src="https://sc-static.net/scevent.min.js"></script>'],
-            'consent_managers': ['<div id="cookie-consent">', 'class="consent-banner"'],
-            'lazy_loading': ['class="lazyload"', 'data-src="image.jpg"'],
-            'spa_frameworks': ['<script src="https://cdnjs.cloudflare.com/ajax/libs/angular.js/1.8.2/angular.min.js"></script>', 
-                               '<script src="https://unpkg.com/react@17/umd/react.production.min.js"></script>']
-        }
+# The detection-worker process's checker, set up once per process by init_detection_worker
+_worker_checker: Optional[tagchecker] = None
 
-        for pattern_name, test_strings in test_strings.items():
-            pattern = getattr(patterns, pattern_name)
-            for test_str in test_strings:
-                match = pattern.search(test_str)
-                if match:
-                    print(f"Pattern '{pattern_name}' matched in: {test_str}")
-                else:
-                    print(f"Pattern '{pattern_name}' did NOT match in: {test_str}")
-        print("All pattern tests completed.")
+def init_detection_worker(plugins: Dict[str, TagDetectorPlugin]):
+    """Build the worker's checker with the parent's plugins"""
+    global _worker_checker
+    _worker_checker = tagchecker(use_javascript=False)
+    _worker_checker.plugins = dict(plugins)
+    _worker_checker.build_console_matchers()
+    _worker_checker.build_request_automaton()
+    _worker_checker.build_signature_database()
+
+def detect_page_in_worker(response: PageResponse, dynamic_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """tagchecker.detect_page in a detection-worker process"""
+    return _worker_checker.detect_page(response.unpacked(), dynamic_data)
 
 def load_urls_from_csv(filename: str, column_name: str = 'URL') -> List[str]:
     """Load URLs from CSV with enhanced validation"""
     urls = []
     try:
-        with open(filename, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+        with open(filename, 'r', encoding='utf-8', newline='') as csvfile:
+            # Plain rows: only one column is read, so no per-row dict is built
+            reader = csv.reader(csvfile)
+            fieldnames = next(reader, None) or []
             
-            if column_name not in reader.fieldnames:
+            if column_name not in fieldnames:
                 print(f"Column '{column_name}' not found in CSV file.")
-                print(f"Available columns: {', '.join(reader.fieldnames)}")
+                print(f"Available columns: {', '.join(fieldnames)}")
                 return urls
             
-            for row_num, row in enumerate(reader, start=2):
-                url = row[column_name].strip() if row[column_name] else ''
+            column = fieldnames.index(column_name)
+            # Blank lines are skipped without being counted, as csv.DictReader does
+            for row_num, row in enumerate((row for row in reader if row), start=2):
+                url = row[column].strip() if column < len(row) else ''
                 if url:
                     # Enhanced URL validation
-                    if not url.startswith(('http://', 'https://')) and '.' in url:
-                        urls.append(url)
-                    elif url.startswith(('http://', 'https://')):
+                    if url.startswith(('http://', 'https://')) or '.' in url:
                         urls.append(url)
                     else:
                         print(f"Skipping invalid URL on row {row_num}: {url}")
@@ -0,0 +1,52 @@
+import pytest
+
+from tag_detector import PATTERNS
+
+# (pattern name, test string, whether the pattern should match it)
+PATTERN_CASES = [
+    ('gtm_container_id', 'GTM-ABC123', True),
+    ('gtm_container_id', 'gtm-xyz789', True),
+    ('gtm_container_id', 'GTM-1234', True),
+    ('gtm_container_id', 'GTM-TOOLONGID12345', True),
+    ('gtm_script_url', 'https://www.googletagmanager.com/gtm.js?id=GTM-ABC123', True),
+    ('gtm_script_url', 'http://googletagmanager.com/gtm.js?id=GTM-XYZ789', False),
+    ('gtm_init_code', "<script>function gtag(){dataLayer.push(arguments);}</script>", False),
+    ('gtm_datalayer', 'dataLayer = [];', True),
+    ('gtm_datalayer', 'var dataLayer = [];', True),
+    ('gtm_dynamic', "var script = document.createElement('script'); script.src = 'https://www.googletagmanager.com/gtm.js?id=GTM-ABC123';", True),
+    ('gtm_noscript', '<noscript><iframe src="https://www.googletagmanager.com/ns.html?id=GTM-ABC123"></iframe></noscript>', True),
+    ('tealium_url', 'https://tags.tiqcdn.com/utag/account/profile/env/utag.js', True),
+    ('tealium_utag_data', 'var utag_data = {};', True),
+    ('tealium_utag_data', 'utag_data.page_name = "Home";', False),
+    ('tealium_async', "(function(a,b,c,d){var e=...;})", False),
+    ('tealium_functions', 'utag.view();', True),
+    ('tealium_functions', 'utag.link();', True),
+    ('tealium_dynamic', "var s=document.createElement('script'); s.src='https://tags.tiqcdn.com/utag/account/profile/env/utag.js';", True),
+    ('ua_tracking_id', 'UA-12345678-1', True),
+    ('ua_tracking_id', 'ua-87654321-2', True),
+    ('ua_script_url', 'https://www.google-analytics.com/analytics.js', True),
+    ('ua_script_url', 'http://www.google-analytics.com/ga.js', False),
+    ('ua_function', 'ga("create", "UA-12345678-1", "auto");', True),
+    ('ua_function', "ga('send', 'pageview');", True),
+    ('ua_dynamic', "var gaScript = document.createElement('script'); gaScript.src = 'https://www.google-analytics.com/analytics.js';", True),
+    ('gtag_script_url', '<script async src="https://www.googletagmanager.com/gtag/js?id=GA-12345678-1"></script>', True),
+    # JavaScript whitespace and digits beyond ASCII, as re's \s and \d match them
+    ('meta_pixel_id', "fbq('init',\u00a0'123456789012345')", True),
+    ('ua_tracking_id', 'UA-\u0661\u0662\u0663\u0664-1', True),
+    ('meta_pixel_script_url', '<script src="https://connect.facebook.net/en_US/fbevents.js"></script>', True),
+    ('tiktok_script_url', '<script src="https://analytics.tiktok.com/i18n/pixel/sdk.js"></script>', False),
+    ('linkedin_script_url', '<script src="https://snap.licdn.com/li.lms-analytics/insight.min.js"></script>', True),
+    ('snap_script_url', '<script src="https://sc-static.net/scevent.min.js"></script>', True),
+    ('consent_managers', '<div id="cookie-consent">', False),
+    ('consent_managers', 'class="consent-banner"', False),
+    ('lazy_loading', 'class="lazyload"', False),
+    ('lazy_loading', 'data-src="image.jpg"', False),
+    ('spa_frameworks', '<script src="https://cdnjs.cloudflare.com/ajax/libs/angular.js/1.8.2/angular.min.js"></script>', True),
+    ('spa_frameworks', '<script src="https://unpkg.com/react@17/umd/react.production.min.js"></script>', True),
+]
+
+
+@pytest.mark.parametrize('pattern_name, test_str, should_match', PATTERN_CASES)
+def test_pattern(pattern_name, test_str, should_match):
+    pattern = getattr(PATTERNS, pattern_name)
+    assert bool(pattern.search(test_str)) is should_match
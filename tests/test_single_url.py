@@ -0,0 +1,165 @@
+import asyncio
+import json
+import re
+
+import pytest
+
+import single_url
+from single_url import SingleUrlTagChecker, export_results, to_json
+
+META_PIXEL_SCRIPT = '<script src="https://connect.facebook.net/en_US/fbevents.js"></script>'
+
+
+def make_checker():
+    return SingleUrlTagChecker(use_javascript=False, timeout=5)
+
+
+def test_extract_scripts_skips_commented_out_scripts():
+    html = f'<html><head><!-- {META_PIXEL_SCRIPT} --><script>var x = 1;</script></head></html>'
+    scripts = make_checker().extract_scripts(html)
+    assert [script['content'] for script in scripts] == ['var x = 1;']
+    assert all(not script['src'] for script in scripts)
+
+
+def test_commented_out_meta_pixel_is_not_detected():
+    html = f'<html><head><!-- {META_PIXEL_SCRIPT} --></head><body></body></html>'
+    results = asyncio.run(make_checker()._run_detectors(html, []))
+    assert results['meta_pixel']['found'] is False
+    assert 'Meta Pixel Script URL Verified' not in results['meta_pixel']['verification_checks']
+
+
+def test_prefiltered_detectors_keep_page_flags():
+    html = '<html><body><div id="root"></div><script src="/static/react.js"></script>' \
+           '<img loading="lazy" src="a.png"></body></html>'
+    checker = make_checker()
+    results = asyncio.run(checker._run_detectors(html, []))
+    expected = checker.detect_gtm(html, checker.extract_scripts(html), []).to_dict()
+    assert results['gtm'] == expected
+    assert results['gtm']['spa_detected'] is True
+    assert results['gtm']['progressive_loading_detected'] is True
+
+
+def sample_result(load_time=1.0):
+    return {'url': 'https://example.com', 'status': 'success', 'load_time': load_time,
+            'detection_results': {'gtm': {'found': True}}}
+
+
+def test_export_skips_unchanged_result_for_the_same_file(tmp_path):
+    filename = str(tmp_path / 'a.json')
+    assert export_results(sample_result(1.0), filename, filename + '.hash')
+    # Only load_time differs, so the file is left alone
+    assert not export_results(sample_result(2.5), filename, filename + '.hash')
+
+
+def test_export_writes_each_requested_file(tmp_path):
+    first, second = str(tmp_path / 'a.json'), str(tmp_path / 'b.json')
+    assert export_results(sample_result(), first, first + '.hash')
+    assert export_results(sample_result(), second, second + '.hash')
+    assert (tmp_path / 'b.json').exists()
+
+
+def test_export_rewrites_a_deleted_file(tmp_path):
+    filename = str(tmp_path / 'a.json')
+    assert export_results(sample_result(), filename, filename + '.hash')
+    (tmp_path / 'a.json').unlink()
+    assert export_results(sample_result(), filename, filename + '.hash')
+    assert (tmp_path / 'a.json').exists()
+
+
+def test_to_json_round_trips_a_result():
+    result = sample_result()
+    assert json.loads(to_json(result)) == result
+    assert json.loads(to_json(result, indent=True)) == result
+    assert to_json(result, indent=True).startswith(b'{\n  ')
+
+
+def test_fast_path_never_starts_the_browser(monkeypatch):
+    checker = make_checker()
+    checker.use_javascript = True
+    html = '<script>(function(w,d,s,l,i){})(window,document,"script","dataLayer","GTM-ABCD1234");</script>'
+    monkeypatch.setattr(checker, 'fetch_html', lambda url: (200, html, False))
+
+    async def no_browser(url):
+        raise AssertionError('the browser should not run on the fast path')
+
+    monkeypatch.setattr(checker, 'execute_javascript', no_browser)
+    result = asyncio.run(checker.analyze_url('https://example.com'))
+    assert result['status'] == 'success'
+    assert result['javascript_executed'] is False
+    assert result['detection_results']['gtm']['found'] is True
+
+
+def test_cancelled_browser_start_leaves_no_partial_state(monkeypatch):
+    stopped = []
+
+    class FakeChromium:
+        async def launch(self, headless=True):
+            raise asyncio.CancelledError()
+
+    class FakePlaywright:
+        chromium = FakeChromium()
+
+        async def stop(self):
+            stopped.append(True)
+
+    class FakeStarter:
+        async def start(self):
+            return FakePlaywright()
+
+    monkeypatch.setattr(single_url, 'async_playwright', lambda: FakeStarter())
+    checker = make_checker()
+
+    async def start_browser():
+        with pytest.raises(asyncio.CancelledError):
+            await checker._get_browser_context()
+
+    asyncio.run(start_browser())
+    assert stopped == [True]
+    assert checker._playwright is None and checker._browser is None and checker._context is None
+
+
+def test_decode_body_detects_the_encoding_without_a_charset_header():
+    text = '<html><body><p>Привет, мир! Это страница без кодировки в заголовках.</p></body></html>'
+    assert SingleUrlTagChecker.decode_body(text.encode('cp1251'), None) == text
+
+
+def test_decode_body_uses_the_header_encoding():
+    assert SingleUrlTagChecker.decode_body('café'.encode('latin-1'), 'ISO-8859-1') == 'café'
+
+
+UNICODE_PAGES = [
+    # NBSP is JavaScript whitespace, and re's \s matches it
+    "<script>fbq('init',\u00a0'123456789012345'); fbq('track', 'PageView');</script>",
+    # Arabic-Indic digits are \d to re
+    "<script>ga('create', 'UA-\u0661\u0662\u0663\u0664\u0665-1', 'auto'); ga('send', 'pageview');</script>",
+    # re.IGNORECASE folds the dotted and dotless i onto ASCII i
+    "<script>var dataLayer\u3000= [];</script><p>GTM-\u0130BCD1234 G-\u0131BCDEFGHIJ</p>",
+]
+
+
+def run_all_detectors(checker, html):
+    return asyncio.run(checker._run_detectors(html, []))
+
+
+@pytest.mark.parametrize('html', UNICODE_PAGES)
+def test_detections_do_not_depend_on_the_regex_engine(monkeypatch, html):
+    checker = make_checker()
+    expected_checker = make_checker()
+    monkeypatch.setattr(single_url, 'RE2_AVAILABLE', False)
+    expected_checker.patterns = single_url.CompiledPatterns()
+    assert run_all_detectors(checker, html) == run_all_detectors(expected_checker, html)
+
+
+def test_re2_rewrite_keeps_python_semantics():
+    pytest.importorskip('re2')
+    cases = [
+        (r'fbq\s*\(\s*["\']init["\']\s*,\s*["\'](\d{15,16})["\']', re.IGNORECASE,
+         "fbq('init',\u00a0'123456789012345')"),
+        (r'UA-\d{4,10}-\d{1,4}', re.IGNORECASE, 'UA-\u0661\u0662\u0663\u0664-1'),
+        (r'GTM-[A-Z0-9]{4,}', re.IGNORECASE, 'gtm-\u0130\u0131ab'),
+        (r'[^"\'\s]+', 0, 'a b'),
+    ]
+    for pattern, flags, text in cases:
+        expected = re.compile(pattern, flags).search(text)
+        actual = single_url.compile_pattern(pattern, flags).search(text)
+        assert actual is not None and actual.span() == expected.span()
@@ -0,0 +1,132 @@
+import pytest
+
+import tag_detector
+from tag_detector import PageResponse, tagchecker
+
+GTM_REQUEST = {'url': 'https://www.googletagmanager.com/gtm.js?id=GTM-ABCD1234',
+               'timestamp': 0.0, 'resource_type': 'script'}
+
+
+def make_checker():
+    return tagchecker(use_javascript=False, timeout=5)
+
+
+def dynamic_data(final_dom, network_requests=(), console_logs=()):
+    return {'network_requests': list(network_requests), 'console_logs': list(console_logs),
+            'final_dom': final_dom}
+
+
+def test_lone_surrogates_do_not_fail_the_page():
+    # The browser hands back unpaired surrogates from page scripts as they are
+    final_dom = '<p>x\ud83d</p> GTM-ABCD1234'
+    response = PageResponse(200, final_dom)
+    results = make_checker().detect_page(response, dynamic_data(final_dom, [GTM_REQUEST], ['gtm \udc00 loaded']))
+    assert results['gtm']['found'] is True
+    assert 'GTM-ABCD1234' in results['gtm']['identifiers']
+
+
+# Pages where byte-oriented or ASCII-only matching would disagree with re
+GATE_PAGES = [
+    '<script>fbq("init",\u00a0"123456789012345"); fbq("track", "PageView");</script>',
+    '<script>ga("create", "UA-\u0661\u0662\u0663\u0664\u0665-1", "auto"); ga("send", "pageview");</script>',
+    '<p>GTM-\u0130BCD1234</p><script>var dataLayer\x1c= [];</script>',
+    '<script>window._lin\u212aedin_data_partner_id = "123456";</script>',
+    # 100 characters but 300 bytes between createElement and the script host
+    '<script>var s = document.createElement("script"); /*' + '\u65e5' * 100 +
+    '*/ s.src = "https://connect.facebook.net/en_US/fbevents.js";</script>',
+    '<script>(function(w,d,s,l,i){w[l].push({"gtm.start": new Date().getTime()});})'
+    '(window,document,"script","dataLayer","GTM-ABCD1234");</script>'
+    '<noscript><iframe src="https://www.googletagmanager.com/ns.html?id=GTM-ABCD1234"></iframe></noscript>',
+]
+
+
+def detect_ungated(monkeypatch, checker, html, scripts):
+    with monkeypatch.context() as patch:
+        patch.setattr(tag_detector.HTML_PATTERN_DB, 'scan', lambda *args: None)
+        patch.setattr(tag_detector.SCRIPT_PATTERN_DB, 'scan', lambda *args: None)
+        patch.setattr(checker, 'signature_database', None)
+        return checker.detect_all_static(html, scripts), checker.detect_all_dynamic([], [], html)
+
+
+@pytest.mark.parametrize('html', GATE_PAGES)
+def test_gated_detection_matches_ungated_detection(monkeypatch, html):
+    checker = make_checker()
+    scripts = checker.extract_static_content(html)['scripts']
+    gated = checker.detect_all_static(html, scripts), checker.detect_all_dynamic([], [], html)
+    assert gated == detect_ungated(monkeypatch, checker, html, scripts)
+
+
+def test_nbsp_meta_pixel_id_is_detected():
+    checker = make_checker()
+    html = GATE_PAGES[0]
+    results = checker.detect_all_static(html, checker.extract_static_content(html)['scripts'])
+    assert 'Pixel ID Detection' in results['meta_pixel'].detection_methods
+
+
+def test_classify_requests_groups_by_plugin_domain():
+    requests = [
+        GTM_REQUEST,
+        {'url': 'https://connect.facebook.net/en_US/fbevents.js'},
+        {'url': 'https://example.com/app.js'},
+    ]
+    requests_by_plugin = make_checker().classify_requests(requests)
+    # gtag shares googletagmanager.com with GTM
+    assert requests_by_plugin['gtm'] == [GTM_REQUEST]
+    assert requests_by_plugin['gtag'] == [GTM_REQUEST]
+    assert requests_by_plugin['meta_pixel'] == [requests[1]]
+    assert requests_by_plugin['tealium'] == []
+
+
+def test_count_console_messages_counts_each_message_once_per_plugin():
+    counts = make_checker().count_console_messages(['GTM loaded, dataLayer ready', 'fbq init', 'nothing'])
+    assert counts['gtm'] == 1
+    assert counts['meta_pixel'] == 1
+    assert counts['tiktok_pixel'] == 0
+
+
+def test_scan_script_elements_skips_comments_and_reads_attributes():
+    html = ('<!-- <script src="https://old.example.com/a.js"></script> -->'
+            '<script async src="https://www.googletagmanager.com/gtm.js?id=GTM-ABCD1234&amp;l=dl"></script>'
+            '<SCRIPT type=module>var x = 1;</SCRIPT >')
+    scripts = make_checker().scan_script_elements(html)
+    assert scripts == [
+        {'src': 'https://www.googletagmanager.com/gtm.js?id=GTM-ABCD1234&l=dl', 'content': '',
+         'type': '', 'async': True, 'defer': False},
+        {'src': '', 'content': 'var x = 1;', 'type': 'module', 'async': False, 'defer': False},
+    ]
+
+
+def test_scan_script_elements_leaves_unclosed_scripts_to_the_parser():
+    assert make_checker().scan_script_elements('<script>document.write("<script>")</script>') is None
+
+
+class CustomPlugin(tag_detector.TagDetectorPlugin):
+    __slots__ = ()
+    signatures = ('custom.js',)
+
+    @property
+    def name(self):
+        return 'Custom'
+
+    @property
+    def version(self):
+        return '1.0.0'
+
+    def detect_static(self, page):
+        scripts = [script['src'] for script in page.scripts if 'custom.js' in script['src']]
+        return tag_detector.TagDetectionResult(found=bool(scripts), identifiers=scripts,
+                                               spa_detected=page.spa)
+
+    def detect_dynamic(self, network_requests, console_logs, dom_content, patterns, **page):
+        return tag_detector.TagDetectionResult()
+
+
+def test_registered_plugin_gets_the_shared_page_scan():
+    checker = make_checker()
+    checker.register_plugin('custom', CustomPlugin())
+    html = '<script src="https://cdn.example.com/custom.js"></script><div id="root">react</div>'
+    results = checker.detect_all_static(html, checker.extract_static_content(html)['scripts'])
+    assert results['custom'].found is True
+    assert results['custom'].identifiers == ['https://cdn.example.com/custom.js']
+    assert results['custom'].spa_detected is True
+    assert results['gtm'].found is False